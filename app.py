@@ -5,14 +5,30 @@ A cute cat-themed timer and alarm clock with a pink UI and smooth animations.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from tkinter import font as tkfont
+from PIL import Image, ImageDraw, ImageFilter, ImageTk
+from collections import OrderedDict
 import time
-import threading
 import os
 import sys
+import signal
+import threading
 import subprocess
 import math
 import random
+import argparse
+import functools
+
+from stopwatch import Stopwatch, format_ns
+from profiler import SamplingProfiler
+from history import HistoryLog, EVENT_TIMER, EVENT_ALARM, EVENT_NAMES, DEFAULT_DIR
+from checkpoint import TimerCheckpoint, capture, restore
+from hooks import HookRunner, load_hooks, HOOKS_FILE
+from telemetry import Telemetry, format_summary
+from scheduler import (AlarmScheduler, TimerSequence, TIMER_SEQUENCES,
+                       make_repeat, interval_start, alarm_label,
+                       REPEAT_DAILY, REPEAT_ONCE, REPEAT_WEEKDAYS,
+                       REPEAT_DATES, REPEAT_INTERVAL)
 
 # ─── Color Palette ───────────────────────────────────────────────────────────
 PINK_DARK      = "#E75480"
@@ -32,6 +48,175 @@ PINK_SHADES = [
     "#FF69B4", "#FF5CA8", "#FF4F9C", "#FF1493",
 ]
 
+# ─── Alarm repeat modes (label, kind, extra rule args) ──────────────────────
+REPEAT_MODES = [
+    ("Daily",    REPEAT_DAILY,    {}),
+    ("Once",     REPEAT_ONCE,     {}),
+    ("Weekdays", REPEAT_WEEKDAYS, {"days": (0, 1, 2, 3, 4)}),
+    ("Weekends", REPEAT_WEEKDAYS, {"days": (5, 6)}),
+    ("Every…",   REPEAT_INTERVAL, {}),
+    ("Dates…",   REPEAT_DATES,    {}),
+]
+
+# ─── Fonts ───────────────────────────────────────────────────────────────────
+# First installed family wins; later entries cover hosts without Helvetica Neue.
+FONT_FAMILIES = ("Helvetica Neue", "Helvetica", "Arial", "DejaVu Sans", "Liberation Sans")
+
+# (size, *styles) used across the UI, created up front by FontRegistry.preload
+FONT_SPECS = [
+    (9,), (10,), (10, "bold"), (11,), (11, "bold"), (11, "italic"),
+    (12, "bold"), (13, "bold"), (14, "bold"), (16,), (16, "bold"),
+    (18,), (22, "bold"), (30, "bold"), (36, "bold"), (40,),
+]
+
+
+class FontRegistry:
+    """Shared ``tkinter.font.Font`` objects keyed by (size, *styles).
+
+    Widgets and canvas items reference the named Tk font, so the family is
+    matched once per size/style instead of on every item creation. Sizes are
+    points at 96 dpi, turned into pixels for the current UI scale; changing
+    the scale reconfigures every font in place and Tk relays out its users.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._fonts = {}
+        self.family = None
+        self.scale = 1.0
+
+    def bind(self, root):
+        """Attach to a Tk root; fonts from a previous interpreter are dropped."""
+        self._root = root
+        self._fonts = {}
+        available = set(tkfont.families(root))
+        self.family = next((f for f in FONT_FAMILIES if f in available), None)
+        if self.family is None:
+            self.family = tkfont.nametofont("TkDefaultFont", root=root).actual("family")
+
+    def preload(self, specs=FONT_SPECS):
+        for spec in specs:
+            self.get(*spec)
+
+    def set_scale(self, scale):
+        self.scale = scale
+        for key, f in self._fonts.items():
+            f.configure(size=self._pixels(key[0]))
+
+    def _pixels(self, size):
+        return -max(1, round(size * 96 / 72 * self.scale))   # negative = pixels in Tk
+
+    def get(self, size, *styles):
+        key = (size,) + styles
+        f = self._fonts.get(key)
+        if f is None:
+            f = tkfont.Font(root=self._root, family=self.family, size=self._pixels(size),
+                            weight="bold" if "bold" in styles else "normal",
+                            slant="italic" if "italic" in styles else "roman")
+            self._fonts[key] = f
+        return f
+
+
+FONTS = FontRegistry()
+
+# ─── Performance profiles ────────────────────────────────────────────────────
+# frame_ms   : step for transitional animations (buttons, ring fill, sparkles)
+# idle_ms    : step for the cat idle loop (None disables the loop entirely)
+# sparkles   : particles per completion burst (0 skips the burst)
+PERF_PROFILES = {
+    "full": {
+        "frame_ms": 16, "idle_ms": 50, "sparkles": 30, "cat_sparkles": 5,
+        "header_glow": True, "idle_bob": True, "zzz": True, "ripple": True,
+        "bounce": True,
+    },
+    "balanced": {
+        "frame_ms": 33, "idle_ms": 100, "sparkles": 15, "cat_sparkles": 3,
+        "header_glow": False, "idle_bob": True, "zzz": True, "ripple": True,
+        "bounce": True,
+    },
+    "low-power": {
+        "frame_ms": 50, "idle_ms": None, "sparkles": 0, "cat_sparkles": 0,
+        "header_glow": False, "idle_bob": False, "zzz": False, "ripple": False,
+        "bounce": False,
+    },
+}
+
+# Active profile, shared by the app and its widgets (see apply_perf_profile)
+PERF = dict(PERF_PROFILES["full"], name="full")
+
+
+def apply_perf_profile(name):
+    """Switch the active performance profile in place."""
+    PERF.clear()
+    PERF.update(PERF_PROFILES[name], name=name)
+
+
+# ─── HiDPI geometry ──────────────────────────────────────────────────────────
+# Layout in 96-dpi pixels; Geometry multiplies it out once per scale factor.
+BASE_GEOMETRY = {
+    "win_w": 520, "win_h": 780,
+    "cat_w": 160, "cat_h": 170, "cat_x": 80, "cat_y": 85,
+    "cat_size": 150, "cat_small": 140, "cat_bob": 4, "cat_bounce": 15,
+    "zzz_x": 130, "zzz_y": 40, "zzz_dx": 10, "zzz_dy": 14, "zzz_wobble": 5,
+    "sparkle_lo": 10, "sparkle_hi": 150, "sparkle_r_lo": 2, "sparkle_r_hi": 5,
+    "ring_size": 230, "ring_c": 115, "ring_r": 95, "ring_w": 14,
+    "ring_text_y": 107, "ring_status_y": 137,
+    "tip_r": 7, "btn_radius": 12,
+    "del_size": 30, "del_c": 15, "del_r": 13,
+    "sw_w": 440, "sw_h": 130, "sw_title_y": 24, "sw_time_y": 76,
+    "lap_row": 24, "lap_col1": 20, "lap_col2": 130, "lap_col3": 270,
+    "alarm_list_h": 140,
+}
+
+
+class Geometry:
+    """Every layout size pre-multiplied for one scale factor."""
+
+    def __init__(self, scale):
+        self.scale = scale
+        for key, value in BASE_GEOMETRY.items():
+            setattr(self, key, round(value * scale))
+        r = BASE_GEOMETRY["ring_r"]
+        self.ring_glow_r = [round((r + 8 + i * 4) * scale) for i in range(3)]
+        self.tip_glow_r = [round((12 - i * 2) * scale) for i in range(3)]
+        self.ring_widths = [round((14 - i * 2) * scale) for i in range(3)]
+        self.line = max(1, round(2 * scale))
+
+    def px(self, value):
+        return round(value * self.scale)
+
+
+_GEOMETRIES = {}
+
+
+def quantize_scale(scale):
+    """Snap to quarter steps (never below 1.0) so caches stay small."""
+    return max(1.0, round(scale * 4) / 4)
+
+
+def geometry_for(scale):
+    g = _GEOMETRIES.get(scale)
+    if g is None:
+        g = _GEOMETRIES[scale] = Geometry(scale)
+    return g
+
+
+def scale_override(scale=None):
+    """Explicit scale from ``--scale`` or $KITTY_SCALE, or None to follow the DPI."""
+    if scale:
+        return quantize_scale(scale)
+    env = os.environ.get("KITTY_SCALE")
+    return quantize_scale(float(env)) if env else None
+
+
+def detect_scale(widget):
+    """UI scale from the screen DPI Tk reports (96 dpi == 1.0)."""
+    try:
+        return quantize_scale(widget.winfo_fpixels("1i") / 96.0)
+    except tk.TclError:
+        return 1.0
+
+
 # ─── Paths ───────────────────────────────────────────────────────────────────
 BASE_DIR   = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
@@ -62,6 +247,11 @@ def play_alert_sound():
 
 
 # ─── Easing Functions ────────────────────────────────────────────────────────
+def ease_linear(t):
+    """No easing."""
+    return t
+
+
 def ease_in_out_cubic(t):
     """Smooth easing for animations."""
     if t < 0.5:
@@ -83,17 +273,39 @@ def ease_out_elastic(t):
     return pow(2, -10 * t) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) + 1
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_hex(c):
+    return int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)
+
+
 def lerp_color(c1, c2, t):
     """Linearly interpolate between two hex colors."""
     t = max(0, min(1, t))
-    r1, g1, b1 = int(c1[1:3], 16), int(c1[3:5], 16), int(c1[5:7], 16)
-    r2, g2, b2 = int(c2[1:3], 16), int(c2[3:5], 16), int(c2[5:7], 16)
+    r1, g1, b1 = _parse_hex(c1)
+    r2, g2, b2 = _parse_hex(c2)
     r = int(r1 + (r2 - r1) * t)
     g = int(g1 + (g2 - g1) * t)
     b = int(b1 + (b2 - b1) * t)
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+# ─── Tween Compiler ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=256)
+def compile_tween(easing, duration_ms, frame_ms, start=0.0, end=1.0):
+    """Keyframe table for a fixed-duration effect, built on first use.
+
+    Returns ``duration_ms // frame_ms + 1`` values from ``start`` to ``end``
+    (hex colors or numbers) with ``easing`` applied, so playback is a tuple
+    index per frame instead of easing + interpolation. Effects whose start
+    varies (an interrupted fade) take the default 0..1 progress table and
+    interpolate it themselves, so they do not fill the cache with one-offs.
+    """
+    steps = max(1, duration_ms // frame_ms)
+    if isinstance(start, str):
+        return tuple(lerp_color(start, end, easing(i / steps)) for i in range(steps + 1))
+    return tuple(start + (end - start) * easing(i / steps) for i in range(steps + 1))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Animated Button
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -101,9 +313,10 @@ class AnimatedButton(tk.Canvas):
     """A button with smooth hover color fade, press scale, and ripple effect."""
 
     def __init__(self, parent, text, command, bg_color, fg_color=WHITE,
-                 font=("Helvetica Neue", 12, "bold"), padx=20, pady=10, **kw):
-        self.btn_width = kw.pop("width", 130)
-        self.btn_height = kw.pop("height", 42)
+                 font=None, padx=20, pady=10, **kw):
+        self.geom = getattr(parent.winfo_toplevel(), "geom", None) or geometry_for(1.0)
+        self._base_size = (kw.pop("width", 130), kw.pop("height", 42))
+        self.btn_width, self.btn_height = (self.geom.px(v) for v in self._base_size)
         super().__init__(parent, width=self.btn_width, height=self.btn_height,
                          bg=parent.cget("bg") if isinstance(parent, tk.Frame) else PINK_PALE,
                          highlightthickness=0, **kw)
@@ -112,7 +325,7 @@ class AnimatedButton(tk.Canvas):
         self.command = command
         self.bg_color = bg_color
         self.fg_color = fg_color
-        self.font = font
+        self.font = font or FONTS.get(12, "bold")
         self._current_bg = bg_color
         self._hover = False
         self._pressed = False
@@ -127,10 +340,16 @@ class AnimatedButton(tk.Canvas):
         self.bind("<ButtonPress-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
 
+    def rescale(self, geom):
+        self.geom = geom
+        self.btn_width, self.btn_height = (geom.px(v) for v in self._base_size)
+        self.config(width=self.btn_width, height=self.btn_height)
+        self._draw()
+
     def _draw(self):
         self.delete("all")
         w, h = self.btn_width, self.btn_height
-        r = 12  # corner radius
+        r = self.geom.btn_radius  # corner radius
 
         # Draw rounded rectangle
         self._draw_rounded_rect(2, 2, w - 2, h - 2, r, self._current_bg)
@@ -140,7 +359,8 @@ class AnimatedButton(tk.Canvas):
             rx, ry, rr, alpha = ripple
             ripple_color = lerp_color(self._current_bg, WHITE, alpha * 0.3)
             self.create_oval(rx - rr, ry - rr, rx + rr, ry + rr,
-                             fill="", outline=ripple_color, width=2, tags="ripple")
+                             fill="", outline=ripple_color, width=self.geom.line,
+                             tags="ripple")
 
         # Draw text
         fg = self.fg_color if not self._disabled else GRAY_TEXT
@@ -194,28 +414,36 @@ class AnimatedButton(tk.Canvas):
 
     def _animate_color(self, from_color, to_color, duration_ms):
         """Smooth color transition over duration."""
+        frame_ms = PERF["frame_ms"]
         if self._anim_id:
+            # Interrupted mid-fade: the start colour is a one-off, so
+            # interpolate a shared progress table instead of caching colours
             self.after_cancel(self._anim_id)
-        steps = max(1, duration_ms // 16)  # ~60fps
+            curve = compile_tween(ease_in_out_cubic, duration_ms, frame_ms)
+            frames = [lerp_color(from_color, to_color, p) for p in curve]
+        else:
+            frames = compile_tween(ease_in_out_cubic, duration_ms, frame_ms, from_color, to_color)
         step = [0]
 
         def tick():
-            if step[0] > steps:
+            if step[0] >= len(frames):
+                self._anim_id = None
                 return
-            t = step[0] / steps
-            t = ease_in_out_cubic(t)
-            self._current_bg = lerp_color(from_color, to_color, t)
+            self._current_bg = frames[step[0]]
             self._draw()
             step[0] += 1
-            self._anim_id = self.after(16, tick)
+            self._anim_id = self.after(frame_ms, tick)
 
         tick()
 
     def _start_ripple(self, x, y):
         """Expanding circle ripple from click point."""
+        if not PERF["ripple"]:
+            return
         max_r = max(self.btn_width, self.btn_height)
         step = [0]
-        total = 20
+        frame_ms = PERF["frame_ms"]
+        total = max(1, 320 // frame_ms)
 
         def tick():
             if step[0] > total:
@@ -228,7 +456,7 @@ class AnimatedButton(tk.Canvas):
             self._ripples = [(x, y, r, alpha)]
             self._draw()
             step[0] += 1
-            self.after(16, tick)
+            self.after(frame_ms, tick)
 
         tick()
 
@@ -246,19 +474,290 @@ class AnimatedButton(tk.Canvas):
         self._draw()
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Virtualized Lap List
+# ═══════════════════════════════════════════════════════════════════════════════
+class VirtualLapList(tk.Frame):
+    """Scrollable lap table that only ever owns one screen of canvas items.
+
+    A fixed pool of text rows is re-labelled on scroll, so the widget cost
+    is the same for 10 laps or 100k. Newest laps are shown first.
+    """
+
+    def __init__(self, parent, laps, height=150, **kw):
+        super().__init__(parent, bg=PINK_PALE, **kw)
+        self.laps = laps
+        self.first = 0
+        self._base_height = height
+        self.canvas = tk.Canvas(self, bg=WHITE, highlightthickness=2,
+                                highlightbackground=PINK_LIGHT)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_to(self.first - 1))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_to(self.first + 1))
+        self.rescale(getattr(parent.winfo_toplevel(), "geom", None) or geometry_for(1.0))
+
+    def rescale(self, g):
+        """(Re)build the row pool for geometry ``g``."""
+        height = g.px(self._base_height)
+        self.canvas.delete("all")
+        self.canvas.config(height=height)
+        self.row_h = g.lap_row
+        self.visible = height // self.row_h + 1
+        self._rows = []
+        for k in range(self.visible):
+            y = g.px(4) + k * self.row_h + self.row_h / 2
+            self._rows.append((
+                self.canvas.create_text(g.lap_col1, y, anchor="w", font=FONTS.get(11, "bold"),
+                                        fill=PINK_TEXT, text=""),
+                self.canvas.create_text(g.lap_col2, y, anchor="w", font=FONTS.get(11),
+                                        fill=DARK_TEXT, text=""),
+                self.canvas.create_text(g.lap_col3, y, anchor="w", font=FONTS.get(11),
+                                        fill=GRAY_TEXT, text=""),
+            ))
+        self._shown = [None] * self.visible
+        self.refresh()
+
+    def refresh(self):
+        """Re-label the row pool for the current scroll position."""
+        n = len(self.laps)
+        self.first = max(0, min(self.first, n - self.visible + 1)) if n else 0
+        for k, items in enumerate(self._rows):
+            i = n - 1 - (self.first + k)
+            if i >= 0:
+                lap = self.laps.lap(i)
+                tag = " ▲" if i == self.laps.best and n > 1 else (
+                      " ▼" if i == self.laps.worst and n > 1 else "")
+                row = (f"Lap {i + 1}", format_ns(lap) + tag, format_ns(self.laps.split(i)))
+            else:
+                row = ("", "", "")
+            if row != self._shown[k]:
+                for item, text in zip(items, row):
+                    self.canvas.itemconfig(item, text=text)
+                self._shown[k] = row
+        if n:
+            self.scrollbar.set(self.first / n, min(1.0, (self.first + self.visible) / n))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, first):
+        self.first = first
+        self.refresh()
+
+    def _on_wheel(self, e):
+        self._scroll_to(self.first - (1 if e.delta > 0 else -1))
+
+    def _on_scroll(self, action, amount, unit=None):
+        n = len(self.laps)
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * n))
+        elif unit == "pages":
+            self._scroll_to(self.first + int(amount) * self.visible)
+        else:
+            self._scroll_to(self.first + int(amount))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Second Ticker
+# ═══════════════════════════════════════════════════════════════════════════════
+class SecondTicker:
+    """Calls subscribers once per wall-clock second, just after each edge.
+
+    One shared ``after`` chain serves every per-second display, and it
+    stops scheduling itself when nobody is subscribed.
+    """
+
+    EDGE_DELAY_MS = 2      # land just past the edge, never just before it
+    EARLY_SLACK   = 0.05   # tolerate timers that fire a few ms early
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._subscribers = []
+        self._job = None
+
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+        if self._job is None:
+            self._schedule()
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        if not self._subscribers and self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def _schedule(self):
+        into_second = time.time() % 1.0
+        delay = int((1.0 - into_second) * 1000) + self.EDGE_DELAY_MS
+        self._job = self.widget.after(delay, self._tick)
+
+    def _tick(self):
+        self._job = None
+        second = int(time.time() + self.EARLY_SLACK)
+        for callback in list(self._subscribers):
+            callback(second)
+        if self._subscribers and self._job is None:
+            self._schedule()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Cat Sprite (retained canvas items)
+# ═══════════════════════════════════════════════════════════════════════════════
+CAT_FALLBACK = {"sleeping": "😴🐱", "alert": "😺🐱", "celebrate": "🎉🐱✨"}
+SPARKLE_COLORS = ["#FFD700", "#FF69B4", "#FF1493", "#FFC0CB"]
+
+
+class CatSprite:
+    """Persistent canvas items for one cat mascot.
+
+    The sprite, the three zzZ glyphs and a fixed pool of sparkle dots are
+    created once; animation only moves them with ``coords`` or recolours
+    them with ``itemconfig``, and a state change swaps the image.
+    """
+
+    def __init__(self, canvas, geom, pool=5):
+        self.canvas = canvas
+        self.build(geom, pool)
+
+    def build(self, geom, pool=5):
+        c = self.canvas
+        c.delete("all")
+        self.geom = geom
+        self.image_item = c.create_image(geom.cat_x, geom.cat_y, anchor="center")
+        self.text_item = c.create_text(geom.cat_x, geom.cat_y, text="",
+                                       font=FONTS.get(40), state="hidden")
+        self.z_items = [c.create_text(0, 0, text=ch, font=FONTS.get(10 + i * 2, "bold"),
+                                      state="hidden")
+                        for i, ch in enumerate(["z", "Z", "z"])]
+        self.sparkle_items = [c.create_oval(0, 0, 0, 0, outline="", state="hidden")
+                              for _ in range(pool)]
+        self._image = None
+        self._text = None
+        self._y = geom.cat_y
+        self._zzz_visible = False
+        self._sparkles_visible = 0
+
+    def show(self, img, state, offset_y=0):
+        """Point the sprite at ``img`` (or the emoji fallback) at ``offset_y``."""
+        c = self.canvas
+        y = self.geom.cat_y + offset_y
+        if img is not None:
+            if img is not self._image:
+                c.itemconfig(self.image_item, image=img, state="normal")
+                if self._text is not None:
+                    c.itemconfig(self.text_item, state="hidden")
+                    self._text = None
+                self._image = img
+            item = self.image_item
+        else:
+            text = CAT_FALLBACK.get(state, "🐱")
+            if text != self._text:
+                c.itemconfig(self.text_item, text=text, state="normal")
+                if self._image is not None:
+                    c.itemconfig(self.image_item, state="hidden")
+                    self._image = None
+                self._text = text
+            item = self.text_item
+        if y != self._y:
+            c.coords(self.image_item, self.geom.cat_x, y)
+            c.coords(self.text_item, self.geom.cat_x, y)
+            self._y = y
+        return item
+
+    def set_zzz(self, frames):
+        """``frames`` is [(x, y, color)] per glyph, or None to hide them."""
+        c = self.canvas
+        if frames is None:
+            if self._zzz_visible:
+                for item in self.z_items:
+                    c.itemconfig(item, state="hidden")
+                self._zzz_visible = False
+            return
+        for item, (x, y, color) in zip(self.z_items, frames):
+            c.coords(item, x, y)
+            c.itemconfig(item, fill=color, state="normal")
+        self._zzz_visible = True
+
+    def set_sparkles(self, dots):
+        """``dots`` is [(x, y, r, color)]; unused pool items are hidden."""
+        c = self.canvas
+        for i, item in enumerate(self.sparkle_items):
+            if i < len(dots):
+                x, y, r, color = dots[i]
+                c.coords(item, x - r, y - r, x + r, y + r)
+                c.itemconfig(item, fill=color, state="normal")
+            elif i < self._sparkles_visible:
+                c.itemconfig(item, state="hidden")
+        self._sparkles_visible = min(len(dots), len(self.sparkle_items))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Text Animation Manager
+# ═══════════════════════════════════════════════════════════════════════════════
+class TextAnimator:
+    """Typewriter reveals with at most one animation per label.
+
+    A new message cancels the label's running reveal (or is dropped if it
+    is the same message), and progress comes from elapsed time, so a slow
+    frame reveals several characters at once instead of falling behind.
+    """
+
+    MAX_DURATION = 1.2   # seconds; long messages reveal more chars per frame
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._active = {}    # label -> [job, text, start, char_s, shown]
+
+    def animate(self, label, text):
+        state = self._active.get(label)
+        if state is not None:
+            if state[1] == text:
+                return  # same message already revealing: coalesce
+            self.widget.after_cancel(state[0])
+        char_s = min(max(15, 40 - len(text)) / 1000, self.MAX_DURATION / max(len(text), 1))
+        label.config(text="", fg=PINK_ACCENT)
+        state = [None, text, time.monotonic(), char_s, 0]
+        self._active[label] = state
+        self._tick(label, state)
+
+    def _tick(self, label, state):
+        _, text, start, char_s, shown = state
+        total = len(text)
+        if not label.winfo_exists():
+            self._active.pop(label, None)
+            return
+        count = min(total, int((time.monotonic() - start) / char_s) + 1)
+        if count != shown:
+            t = count / max(total, 1)
+            label.config(text=text[:count],
+                         fg=lerp_color(PINK_ACCENT, PINK_TEXT, ease_in_out_cubic(t)))
+            state[4] = count
+        if count >= total:
+            label.config(fg=PINK_TEXT)
+            self._active.pop(label, None)
+            return
+        state[0] = self.widget.after(PERF["frame_ms"], self._tick, label, state)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Sparkle Particle System
 # ═══════════════════════════════════════════════════════════════════════════════
 class SparkleOverlay:
     """Canvas-based sparkle/confetti particles."""
 
-    def __init__(self, canvas, cx, cy):
+    def __init__(self, canvas, cx, cy, count=30):
         self.canvas = canvas
         self.particles = []
         self.running = False
+        self.frame_ms = PERF["frame_ms"]
+        self._dt = self.frame_ms / 16  # physics was tuned for 16 ms steps
         colors = ["#FFD700", "#FF69B4", "#FF1493", "#FFC0CB", "#FFB6C1",
                   "#FF6B81", "#FF85C8", "#FFDAB9", "#FFF0F5"]
-        for _ in range(30):
+        for _ in range(count):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 6)
             self.particles.append({
@@ -275,6 +774,8 @@ class SparkleOverlay:
             })
 
     def start(self):
+        if not self.particles:
+            return
         self.running = True
         self._tick()
 
@@ -287,11 +788,12 @@ class SparkleOverlay:
             if p["life"] <= 0:
                 continue
             alive = True
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            p["vy"] += 0.15  # gravity
-            p["life"] -= p["decay"]
-            p["rotation"] += p["rot_speed"]
+            dt = self._dt
+            p["x"] += p["vx"] * dt
+            p["y"] += p["vy"] * dt
+            p["vy"] += 0.15 * dt  # gravity
+            p["life"] -= p["decay"] * dt
+            p["rotation"] += p["rot_speed"] * dt
 
             alpha = max(0, p["life"])
             size = p["size"] * alpha
@@ -308,7 +810,7 @@ class SparkleOverlay:
                 )
 
         if alive:
-            self.canvas.after(16, self._tick)
+            self.canvas.after(self.frame_ms, self._tick)
         else:
             self.running = False
             self.canvas.delete("sparkle")
@@ -331,18 +833,254 @@ class SparkleOverlay:
         self.canvas.create_polygon(points, fill=color, outline="", tags="sparkle")
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Offscreen Ring Renderer
+# ═══════════════════════════════════════════════════════════════════════════════
+def hex_to_rgb(c):
+    return int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)
+
+
+class RingRenderer:
+    """Antialiased progress ring drawn with PIL and cached per quantized fraction.
+
+    Frames are rendered ``supersample`` times larger and downsampled, then
+    kept as ``PhotoImage`` objects in an LRU, so a repaint is a single
+    ``itemconfig`` on the canvas image item. Frames the caller knows it will
+    need are rendered ahead by ``prefetch`` on a worker thread, so the Tk
+    thread only wraps the finished image. ``cache_bytes`` caps both: up to a
+    quarter of it holds prefetched images, the rest the LRU.
+    """
+
+    PREFETCH_MAX = 64      # prefetched images held at most, within the budget
+
+    def __init__(self, geom, steps=720, supersample=3, cache_bytes=32 * 1024 * 1024):
+        self.scale = geom.scale
+        self.size = geom.ring_size
+        self.radius = geom.ring_r
+        self.width = geom.ring_w
+        self.tip_r = BASE_GEOMETRY["tip_r"]
+        self.steps = steps
+        self.ss = supersample
+        self.k = geom.scale * supersample   # base px -> supersampled px
+        self.frame_bytes = self.size * self.size * 4
+        budget = max(2, int(cache_bytes) // self.frame_bytes)
+        self.max_ready = min(self.PREFETCH_MAX, budget // 4)
+        self.max_frames = max(1, budget - self.max_ready)
+        self._frames = OrderedDict()
+        self._base = None
+        self._gradient = None
+        self._tip = None
+        self.hits = 0          # served from the LRU
+        self.prefetched = 0    # rendered ahead by the worker
+        self.misses = 0        # rendered on the Tk thread
+        # prefetch worker: wanted keys in order, rendered PIL images waiting for Tk
+        self._wanted = {}
+        self._ready = OrderedDict()
+        self._inflight = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = True
+
+    def quantize(self, fraction):
+        return max(0, min(self.steps, round(fraction * self.steps)))
+
+    def frame(self, fraction):
+        """Return the cached ``PhotoImage`` for ``fraction``, rendering on a miss."""
+        q = self.quantize(fraction)
+        photo = self._frames.get(q)
+        if photo is not None:
+            self._frames.move_to_end(q)
+            self.hits += 1
+            return photo
+        with self._cond:
+            self._wanted.pop(q, None)
+            while self._inflight == q:
+                self._cond.wait()      # the worker is already on it; don't render twice
+            img = self._ready.pop(q, None)
+        if img is not None:
+            self.prefetched += 1
+        else:
+            self.misses += 1
+            img = self.render(q / self.steps)
+        photo = ImageTk.PhotoImage(img)
+        self._frames[q] = photo
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+        return photo
+
+    def stats(self):
+        """``(frames served, share from the LRU, share prefetched)``."""
+        total = self.hits + self.prefetched + self.misses
+        if not total:
+            return 0, 0.0, 0.0
+        return total, self.hits / total, self.prefetched / total
+
+    def prefetch(self, fractions):
+        """Render the frames for ``fractions`` ahead of time, off the Tk thread."""
+        if not self.max_ready:
+            return
+        with self._cond:
+            if not self._running:
+                return
+            for fraction in fractions:
+                q = self.quantize(fraction)
+                if q not in self._frames and q not in self._ready and q != self._inflight:
+                    self._wanted[q] = True
+            if not self._wanted:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._prefetch_worker,
+                                                name="kitty-ring", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _prefetch_worker(self):
+        while True:
+            with self._cond:
+                while self._running and not self._wanted:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                q = next(iter(self._wanted))
+                del self._wanted[q]
+                self._inflight = q
+            img = self.render(q / self.steps)
+            with self._cond:
+                self._ready[q] = img
+                while len(self._ready) > self.max_ready:
+                    self._ready.popitem(last=False)
+                self._inflight = None
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    # ── rendering (PIL only, no Tk) ──
+    def render(self, fraction):
+        """Render the ring for ``fraction`` as an RGBA image of ``size``."""
+        ss = self.ss
+        big = self.size * ss
+        c = big / 2
+        r = self.radius * ss
+        w = round(self.width * ss)
+        img = self._base_image().copy()
+
+        if fraction > 0:
+            sweep = 360 * fraction
+            # Reveal the precomputed gradient ring through a pie-slice mask
+            mask = Image.new("L", (big, big), 0)
+            pad = r + w
+            ImageDraw.Draw(mask).pieslice((c - pad, c - pad, c + pad, c + pad),
+                                          -90, -90 + sweep, fill=255)
+            progress = Image.new("RGBA", (big, big), (0, 0, 0, 0))
+            progress.paste(self._gradient_ring(), mask=mask)
+            img.alpha_composite(progress)
+
+            draw = ImageDraw.Draw(img)
+            # Rounded start cap
+            draw.ellipse((c - w / 2, c - r - w / 2, c + w / 2, c - r + w / 2),
+                         fill=hex_to_rgb(PINK_MAIN) + (255,))
+
+            angle = math.radians(-90 + sweep)
+            tip = self._tip_sprite()
+            tx = int(c + r * math.cos(angle) - tip.width / 2)
+            ty = int(c + r * math.sin(angle) - tip.height / 2)
+            img.alpha_composite(tip, (max(0, tx), max(0, ty)))
+
+        # Box-filter downsample is exact for integer supersampling
+        return img.reduce(ss)
+
+    def _gradient_ring(self):
+        """Full progress ring shaded PINK_MAIN → PINK_ACCENT clockwise from 12 o'clock."""
+        if self._gradient is None:
+            ss = self.ss
+            big = self.size * ss
+            c = big / 2
+            r = self.radius * ss
+            w = round(self.width * ss)
+            img = Image.new("RGBA", (big, big), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            box = (c - r - w / 2, c - r - w / 2, c + r + w / 2, c + r + w / 2)
+            c1, c2 = hex_to_rgb(PINK_MAIN), hex_to_rgb(PINK_ACCENT)
+            segments = 180
+            for i in range(segments):
+                t = i / segments
+                color = tuple(int(a + (b - a) * t) for a, b in zip(c1, c2))
+                start = -90 + 360 * i / segments
+                draw.arc(box, start, start + 360 / segments + 0.5,
+                         fill=color + (255,), width=w)
+            self._gradient = img
+        return self._gradient
+
+    def _base_image(self):
+        """Background ring and outer glow, shared by every frame."""
+        if self._base is None:
+            ss = self.ss
+            big = self.size * ss
+            c = big / 2
+            img = Image.new("RGBA", (big, big), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            light = hex_to_rgb(PINK_LIGHT)
+            k = self.k
+            for i in range(3):
+                gr = self.radius * ss + (8 + i * 4) * k
+                alpha = int(255 * (0.4 - i * 0.125))
+                draw.ellipse((c - gr, c - gr, c + gr, c + gr),
+                             outline=light + (alpha,), width=max(1, round(2 * k)))
+            r = self.radius * ss
+            w = round(self.width * ss)
+            draw.ellipse((c - r - w / 2, c - r - w / 2, c + r + w / 2, c + r + w / 2),
+                         outline=light + (255,), width=w)
+            self._base = img
+        return self._base
+
+    def _tip_sprite(self):
+        """Blurred glow halo with the white tip dot on top."""
+        if self._tip is None:
+            k = self.k
+            half = round(18 * k)
+            sprite = Image.new("RGBA", (2 * half, 2 * half), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(sprite)
+            gr = 11 * k
+            draw.ellipse((half - gr, half - gr, half + gr, half + gr),
+                         fill=hex_to_rgb(PINK_ACCENT) + (150,))
+            sprite = sprite.filter(ImageFilter.GaussianBlur(4 * k))
+            draw = ImageDraw.Draw(sprite)
+            dr = self.tip_r * k
+            draw.ellipse((half - dr, half - dr, half + dr, half + dr),
+                         fill=hex_to_rgb(WHITE) + (255,),
+                         outline=hex_to_rgb(PINK_ACCENT) + (255,), width=round(2 * k))
+            self._tip = sprite
+        return self._tip
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Main Application
 # ═══════════════════════════════════════════════════════════════════════════════
 class KittyTimerApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, profile="full", ring_backend="image", ring_cache_mb=None,
+                 history_dir=DEFAULT_DIR, scale=None, profile_seconds=10.0):
         super().__init__()
+        FONTS.bind(self)
+        FONTS.preload()
         self.title("🐱 Kitty Timer & Alarm")
         self.configure(bg=PINK_PALE)
         self.resizable(False, False)
 
+        # ── HiDPI scale & window size ──
+        # An explicit --scale / $KITTY_SCALE pins the scale; otherwise it
+        # follows the DPI of the monitor the window is on (see _on_configure).
+        self._scale_override = scale_override(scale)
+        self.ui_scale = self._scale_override or detect_scale(self)
+        self.geom = geometry_for(self.ui_scale)
+        FONTS.set_scale(self.ui_scale)
+        self._image_cache = {}       # (asset, size, scale) -> PhotoImage
+        self._ring_cache_mb = ring_cache_mb
+
         # ── Window size & centering ──
-        win_w, win_h = 520, 780
+        win_w, win_h = self.geom.win_w, self.geom.win_h
         scr_w = self.winfo_screenwidth()
         scr_h = self.winfo_screenheight()
         x = (scr_w - win_w) // 2
@@ -362,48 +1100,151 @@ class KittyTimerApp(tk.Tk):
         self.timer_paused = False
         self.timer_total_seconds = 0
         self.timer_remaining = 0
+        self.timer_deadline = 0.0   # time.monotonic() at which the countdown ends
+        self.timer_left = 0.0       # exact seconds left while paused
+        self.timer_sequence = None  # TimerSequence while a chain is running
+        self._sequence_names = [None] + list(TIMER_SEQUENCES)
+        self._sequence_index = 0
         self.timer_job = None
+        self.timer_tick_job = None
+        self.timer_deadline_wall = None  # wall-clock twin of timer_deadline, for telemetry
         self._ring_anim_fraction = 0.0  # for smooth ring interpolation
+        self.ring_backend = ring_backend
+        self.ring_renderer = self._make_ring_renderer()
+
+        self.muted = False
+
+        # ── History ──
+        self.history = HistoryLog(history_dir)
+        self.checkpoint = TimerCheckpoint(history_dir)
+        self._stats_window = None
+        self.hooks = HookRunner(*load_hooks(history_dir), on_result=self._on_hook_result)
+        for problem in self.hooks.problems:
+            print(f"🐱 {HOOKS_FILE}: skipped {problem}", file=sys.stderr)
+        self.telemetry = Telemetry(history_dir)
+
+        # ── Stopwatch State ──
+        self.stopwatch = Stopwatch()
+        self._sw_job = None
+        self._sw_text = None
 
         # ── Alarm State ──
         self.alarms = []
         self.alarm_counter = 0
-        self.alarm_check_running = True
+        self.alarm_scheduler = AlarmScheduler(self._on_alarm_due)
 
         # ── Cat animation state ──
         self._cat_bob_phase = 0
         self._cat_current_state = "sleeping"
         self._cat_pulse_job = None
+        self._cat_idle_job = None
+        self.cat_sprites = {}       # canvas -> CatSprite
+        self._header_glow_job = None
 
         # ── Build UI ──
         self._build_header()
         self._build_notebook()
 
         # ── Start background threads / loops ──
-        self.alarm_thread = threading.Thread(target=self._alarm_checker, daemon=True)
-        self.alarm_thread.start()
+        self.alarm_scheduler.start()
+        self.ticker = SecondTicker(self)
+        self.text_animator = TextAnimator(self)
         self._update_clock()
-        self._animate_cat_idle()
-        self._animate_header_glow()
-
+        self.ticker.subscribe(self._update_clock)
+        self.set_perf_profile(profile)
+        self._restore_timer()
+
+        self.bind("<Configure>", self._on_configure)
+
+        # ── On-demand profiler: SIGUSR1 or Ctrl+Alt+P toggles a capture ──
+        self.profiler = SamplingProfiler(
+            {"tk": threading.main_thread(), "alarms": lambda: self.alarm_scheduler.thread},
+            directory=os.path.join(history_dir, "profiles"),
+            duration=profile_seconds, on_done=self._on_profile_done)
+        self.bind_all("<Control-Alt-p>", lambda e: self.profiler.toggle())
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.profiler.toggle())
+            signal.signal(signal.SIGUSR2, lambda signum, frame: self._dump_telemetry())
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ─── Load Images ─────────────────────────────────────────────────────────
+    def _scaled_image(self, fname, size):
+        """PhotoImage for ``fname`` at ``size`` px, rendered once per scale."""
+        key = (fname, size, self.ui_scale)
+        if key not in self._image_cache:
+            try:
+                img = Image.open(resource_path(fname)).convert("RGBA")
+                self._image_cache[key] = ImageTk.PhotoImage(
+                    img.resize((size, size), Image.LANCZOS))
+            except Exception:
+                self._image_cache[key] = None
+        return self._image_cache[key]
+
     def _load_cat_images(self):
-        sizes = {"normal": (150, 150), "small": (140, 140)}
+        g = self.geom
         for key, fname in [("sleeping", "cat_sleeping.png"),
                            ("alert", "cat_alert.png"),
                            ("celebrate", "cat_celebrate.png")]:
-            path = resource_path(fname)
-            try:
-                img = Image.open(path).convert("RGBA")
-                img_n = img.resize(sizes["normal"], Image.LANCZOS)
-                img_s = img.resize(sizes["small"], Image.LANCZOS)
-                self.cat_images[key] = ImageTk.PhotoImage(img_n)
-                self.cat_images_small[key] = ImageTk.PhotoImage(img_s)
-            except Exception:
-                self.cat_images[key] = None
-                self.cat_images_small[key] = None
+            self.cat_images[key] = self._scaled_image(fname, g.cat_size)
+            self.cat_images_small[key] = self._scaled_image(fname, g.cat_small)
+
+    def _make_ring_renderer(self):
+        if self.ring_backend != "image":
+            return None
+        mb = self._ring_cache_mb
+        if mb is None:
+            mb = 32 * self.ui_scale ** 2   # same frame count as 32 MB at 1x
+        return RingRenderer(self.geom, cache_bytes=int(mb * 1024 * 1024))
+
+    def _on_configure(self, event):
+        """Re-check the DPI when the toplevel moves (e.g. onto another monitor)."""
+        if event.widget is not self or self._scale_override:
+            return
+        scale = detect_scale(self)
+        if scale != self.ui_scale:
+            self._apply_scale(scale)
+
+    def _apply_scale(self, scale):
+        """Resize every widget for a new scale; images come from the per-scale cache."""
+        self.ui_scale = scale
+        g = self.geom = geometry_for(scale)
+        FONTS.set_scale(scale)
+        self._load_cat_images()
+        for canvas in (self.timer_cat_canvas, self.alarm_cat_canvas):
+            canvas.config(width=g.cat_w, height=g.cat_h)
+            self.cat_sprites[canvas].build(g)
+            self._draw_cat_on_canvas(canvas, self._cat_current_state)
+
+        # Ring: a renderer for the new size replaces the old one (one budget at a time)
+        if self.ring_renderer is not None:
+            self.ring_renderer.close()
+        self.ring_renderer = self._make_ring_renderer()
+        self._ring_photo = None
+        c = self.timer_canvas
+        c.config(width=g.ring_size, height=g.ring_size)
+        c.coords(self._ring_image_item, g.ring_c, g.ring_c)
+        c.coords(self._ring_time_item, g.ring_c, g.ring_text_y)
+        c.coords(self._ring_status_item, g.ring_c, g.ring_status_y)
+        self._draw_timer_ring(self._ring_anim_fraction)
+
+        self.sw_canvas.config(width=g.sw_w, height=g.sw_h)
+        self.sw_canvas.coords(self._sw_title_item, g.sw_w // 2, g.sw_title_y)
+        self.sw_canvas.coords(self._sw_time_item, g.sw_w // 2, g.sw_time_y)
+
+        # Buttons and the lap list resize themselves; alarm cards are rebuilt
+        stack = [self]
+        while stack:
+            w = stack.pop()
+            if hasattr(w, "rescale"):
+                w.rescale(g)
+            stack.extend(w.winfo_children())
+        self.alarm_canvas_list.config(height=g.alarm_list_h)
+        for card in list(self.alarm_list_frame.winfo_children()):
+            if hasattr(card, "alarm_id") and not getattr(card, "deleting", False):
+                card.destroy()
+        for alarm in self.alarms:
+            self._render_alarm_item(alarm, animate=False)
+        self.geometry(f"{g.win_w}x{g.win_h}")
 
     # ─── Styles ──────────────────────────────────────────────────────────────
     def _setup_styles(self):
@@ -413,7 +1254,7 @@ class KittyTimerApp(tk.Tk):
         style.configure("Pink.TNotebook", background=PINK_PALE, borderwidth=0)
         style.configure("Pink.TNotebook.Tab",
                         background=PINK_LIGHT, foreground=DARK_TEXT,
-                        padding=[22, 10], font=("Helvetica Neue", 13, "bold"))
+                        padding=[16, 10], font=FONTS.get(13, "bold"))
         style.map("Pink.TNotebook.Tab",
                   background=[("selected", PINK_MAIN)],
                   foreground=[("selected", WHITE)])
@@ -427,15 +1268,28 @@ class KittyTimerApp(tk.Tk):
 
         self.header_label = tk.Label(self.header_frame,
                                      text="🐱  Kitty Timer & Alarm",
-                                     font=("Helvetica Neue", 22, "bold"),
+                                     font=FONTS.get(22, "bold"),
                                      fg=PINK_DARK, bg=PINK_PALE)
         self.header_label.pack()
 
         self.sub_label = tk.Label(self.header_frame,
                                   text="Your purrfect time companion  ✨",
-                                  font=("Helvetica Neue", 11), fg=PINK_TEXT, bg=PINK_PALE)
+                                  font=FONTS.get(11), fg=PINK_TEXT, bg=PINK_PALE)
         self.sub_label.pack()
 
+        # Performance profile toggle (click to cycle)
+        self.profile_label = tk.Label(self.header_frame, text="",
+                                      font=FONTS.get(9), fg=GRAY_TEXT,
+                                      bg=PINK_PALE, cursor="hand2")
+        self.profile_label.place(relx=1.0, x=-12, y=0, anchor="ne")
+        self.profile_label.bind("<Button-1>", lambda e: self._cycle_perf_profile())
+
+        # History stats (click to open)
+        stats_label = tk.Label(self.header_frame, text="📊 stats", font=FONTS.get(9),
+                               fg=GRAY_TEXT, bg=PINK_PALE, cursor="hand2")
+        stats_label.place(relx=0.0, x=12, y=0, anchor="nw")
+        stats_label.bind("<Button-1>", lambda e: self._show_stats())
+
     def _animate_header_glow(self):
         """Subtle color cycling on the header text."""
         phase = (time.time() * 0.5) % 1.0
@@ -443,7 +1297,37 @@ class KittyTimerApp(tk.Tk):
         t = (math.sin(phase * 2 * math.pi) + 1) / 2
         color = lerp_color(PINK_DARK, PINK_ACCENT, t * 0.4)
         self.header_label.config(fg=color)
-        self.after(50, self._animate_header_glow)
+        self._header_glow_job = self.after(50, self._animate_header_glow)
+
+    # ─── Performance profile ─────────────────────────────────────────────────
+    def set_perf_profile(self, name):
+        """Apply a profile and (re)start only the decorative loops it allows.
+
+        With every loop disabled nothing is scheduled between timer/clock
+        ticks, so the event loop sleeps.
+        """
+        apply_perf_profile(name)
+        self.profile_label.config(text=f"⚡ {name}")
+
+        for job in (self._header_glow_job, self._cat_idle_job):
+            if job:
+                self.after_cancel(job)
+        self._header_glow_job = self._cat_idle_job = None
+
+        if PERF["header_glow"]:
+            self._animate_header_glow()
+        else:
+            self.header_label.config(fg=PINK_DARK)
+
+        if PERF["idle_ms"]:
+            self._animate_cat_idle()
+        else:
+            for canvas in (self.timer_cat_canvas, self.alarm_cat_canvas):
+                self._draw_cat_on_canvas(canvas, self._cat_current_state)
+
+    def _cycle_perf_profile(self):
+        names = list(PERF_PROFILES)
+        self.set_perf_profile(names[(names.index(PERF["name"]) + 1) % len(names)])
 
     # ─── Notebook (Tabs) ─────────────────────────────────────────────────────
     def _build_notebook(self):
@@ -458,6 +1342,10 @@ class KittyTimerApp(tk.Tk):
         self.notebook.add(self.alarm_frame, text="  ⏰  Alarm  ")
         self._build_alarm_tab()
 
+        self.stopwatch_frame = ttk.Frame(self.notebook, style="Pink.TFrame")
+        self.notebook.add(self.stopwatch_frame, text="  ⏲  Stopwatch  ")
+        self._build_stopwatch_tab()
+
     # ═══════════════════════════════════════════════════════════════════════════
     #  TIMER TAB
     # ═══════════════════════════════════════════════════════════════════════════
@@ -465,19 +1353,29 @@ class KittyTimerApp(tk.Tk):
         parent = self.timer_frame
 
         # ── Cat mascot on canvas (for animation) ──
-        self.timer_cat_canvas = tk.Canvas(parent, width=160, height=170,
+        g = self.geom
+        self.timer_cat_canvas = tk.Canvas(parent, width=g.cat_w, height=g.cat_h,
                                           bg=PINK_PALE, highlightthickness=0)
         self.timer_cat_canvas.pack(pady=(10, 0))
+        self.cat_sprites[self.timer_cat_canvas] = CatSprite(self.timer_cat_canvas, g)
 
         self.timer_cat_text = tk.Label(parent, text="zzZ... Set a timer, I'll wake up!",
-                                       font=("Helvetica Neue", 11, "italic"),
+                                       font=FONTS.get(11, "italic"),
                                        fg=PINK_TEXT, bg=PINK_PALE)
         self.timer_cat_text.pack(pady=(0, 4))
 
         # ── Circular progress + time display (canvas) ──
-        self.timer_canvas = tk.Canvas(parent, width=230, height=230,
+        self.timer_canvas = tk.Canvas(parent, width=g.ring_size, height=g.ring_size,
                                       bg=PINK_PALE, highlightthickness=0)
         self.timer_canvas.pack(pady=(4, 8))
+        # Persistent items: ring image (image backend) + centre texts
+        self._ring_image_item = self.timer_canvas.create_image(g.ring_c, g.ring_c, tags="ring")
+        self._ring_photo = None
+        self._ring_time_item = self.timer_canvas.create_text(
+            g.ring_c, g.ring_text_y, text="", font=FONTS.get(30, "bold"), fill=PINK_DARK)
+        self._ring_status_item = self.timer_canvas.create_text(
+            g.ring_c, g.ring_status_y, text="", font=FONTS.get(10), fill=PINK_TEXT)
+        self._ring_texts = (None, None)
         self._draw_timer_ring(0)
 
         # ── Input row ──
@@ -489,18 +1387,23 @@ class KittyTimerApp(tk.Tk):
                                                        ("Sec", "timer_s")]):
             sub = tk.Frame(input_frame, bg=PINK_PALE)
             sub.grid(row=0, column=col, padx=10)
-            tk.Label(sub, text=label_text, font=("Helvetica Neue", 10, "bold"),
+            tk.Label(sub, text=label_text, font=FONTS.get(10, "bold"),
                      fg=PINK_TEXT, bg=PINK_PALE).pack()
             var = tk.StringVar(value="0")
             setattr(self, var_name, var)
             sb = tk.Spinbox(sub, from_=0, to=59 if var_name != "timer_h" else 99,
-                            textvariable=var, width=4, font=("Helvetica Neue", 18),
+                            textvariable=var, width=4, font=FONTS.get(18),
                             justify="center", wrap=True,
                             bg=WHITE, fg=DARK_TEXT, buttonbackground=PINK_LIGHT,
                             relief="flat", bd=2, highlightbackground=PINK_LIGHT,
                             highlightcolor=PINK_MAIN)
             sb.pack()
 
+        # Sequence picker (single timer or a named chain of phases)
+        self.sequence_btn = AnimatedButton(parent, "⏱  Single timer", self._cycle_sequence,
+                                           PINK_LIGHT, fg_color=DARK_TEXT, width=200, height=30)
+        self.sequence_btn.pack(pady=(2, 0))
+
         # ── Animated Buttons ──
         btn_frame = tk.Frame(parent, bg=PINK_PALE)
         btn_frame.pack(pady=(8, 10))
@@ -523,59 +1426,73 @@ class KittyTimerApp(tk.Tk):
 
     # ── Draw progress ring with glow ─────────────────────────────────────────
     def _draw_timer_ring(self, fraction):
+        if self.ring_renderer is not None:
+            photo = self.ring_renderer.frame(fraction)
+            if photo is not self._ring_photo:
+                self._ring_photo = photo
+                self.timer_canvas.itemconfig(self._ring_image_item, image=photo)
+        else:
+            self._draw_ring_arcs(fraction)
+        self._draw_ring_text()
+
+    def _draw_ring_arcs(self, fraction):
+        """Tk-primitive ring backend: stacked arcs and ovals, redrawn each frame."""
         c = self.timer_canvas
-        c.delete("all")
-        cx, cy, r = 115, 115, 95
+        c.delete("ring")
+        g = self.geom
+        cx = cy = g.ring_c
+        r = g.ring_r
 
         # Outer glow
-        for i in range(3):
-            glow_r = r + 8 + i * 4
+        for i, glow_r in enumerate(g.ring_glow_r):
             glow_alpha = 0.08 - i * 0.025
             glow_color = lerp_color(PINK_PALE, PINK_LIGHT, glow_alpha * 5)
             c.create_arc(cx - glow_r, cy - glow_r, cx + glow_r, cy + glow_r,
-                         outline=glow_color, width=2, style="arc",
-                         start=0, extent=359.9)
+                         outline=glow_color, width=g.line, style="arc",
+                         start=0, extent=359.9, tags="ring")
 
         # Background ring
         c.create_arc(cx - r, cy - r, cx + r, cy + r,
-                     outline=PINK_LIGHT, width=14, style="arc",
-                     start=0, extent=359.9)
+                     outline=PINK_LIGHT, width=g.ring_w, style="arc",
+                     start=0, extent=359.9, tags="ring")
 
         # Progress arc with gradient effect
         if fraction > 0:
             extent = -359.9 * fraction
             # Multiple thin arcs for gradient feel
-            for i in range(3):
-                offset = i * 0.5
+            for i, width in enumerate(g.ring_widths):
                 shade = lerp_color(PINK_MAIN, PINK_ACCENT, i / 3)
                 c.create_arc(cx - r, cy - r, cx + r, cy + r,
-                             outline=shade, width=14 - i * 2, style="arc",
-                             start=90, extent=extent)
+                             outline=shade, width=width, style="arc",
+                             start=90, extent=extent, tags="ring")
 
             # Glowing tip dot
             angle_rad = math.radians(90 + 360 * fraction)
             dot_x = cx - r * math.cos(angle_rad)
             dot_y = cy - r * math.sin(angle_rad)
             # Glow behind dot
-            for glow_i in range(3):
-                gr = 12 - glow_i * 2
+            for glow_i, gr in enumerate(g.tip_glow_r):
                 gc = lerp_color(PINK_ACCENT, PINK_PALE, glow_i * 0.3)
                 c.create_oval(dot_x - gr, dot_y - gr, dot_x + gr, dot_y + gr,
-                              fill=gc, outline="")
+                              fill=gc, outline="", tags="ring")
             # Dot itself
-            c.create_oval(dot_x - 7, dot_y - 7, dot_x + 7, dot_y + 7,
-                          fill=WHITE, outline=PINK_ACCENT, width=2)
-
-        # Centre text
-        remaining = self.timer_remaining if hasattr(self, 'timer_remaining') else 0
+            tr = g.tip_r
+            c.create_oval(dot_x - tr, dot_y - tr, dot_x + tr, dot_y + tr,
+                          fill=WHITE, outline=PINK_ACCENT, width=g.line, tags="ring")
+        c.tag_lower("ring")
+
+    def _draw_ring_text(self):
+        """Update the centre time/status texts only when they change."""
+        remaining = self.timer_remaining
         mins, secs = divmod(remaining, 60)
         hrs, mins = divmod(mins, 60)
         time_str = f"{hrs:02d}:{mins:02d}:{secs:02d}"
-        c.create_text(cx, cy - 8, text=time_str,
-                      font=("Helvetica Neue", 30, "bold"), fill=PINK_DARK)
 
         # Status text under time
-        if self.timer_running:
+        seq = self.timer_sequence
+        if self.timer_running and seq is not None and not seq.finished:
+            status = f"{seq.label} · {seq.index + 1}/{len(seq)}"
+        elif self.timer_running:
             status = "counting down..."
         elif self.timer_paused:
             status = "paused"
@@ -583,8 +1500,13 @@ class KittyTimerApp(tk.Tk):
             status = "✨ done! ✨"
         else:
             status = "ready"
-        c.create_text(cx, cy + 22, text=status,
-                      font=("Helvetica Neue", 10), fill=PINK_TEXT)
+
+        last_time, last_status = self._ring_texts
+        if time_str != last_time:
+            self.timer_canvas.itemconfig(self._ring_time_item, text=time_str)
+        if status != last_status:
+            self.timer_canvas.itemconfig(self._ring_status_item, text=status)
+        self._ring_texts = (time_str, status)
 
     # ── Smooth ring animation (interpolate between frames) ───────────────────
     def _animate_ring_to(self, target_fraction, callback=None):
@@ -592,22 +1514,24 @@ class KittyTimerApp(tk.Tk):
         start = self._ring_anim_fraction
         diff = target_fraction - start
         duration = 800  # ms
-        steps = max(1, duration // 16)
+        frame_ms = PERF["frame_ms"]
+        curve = compile_tween(ease_in_out_cubic, duration, frame_ms)
         step = [0]
+        if self.ring_renderer is not None:
+            self.ring_renderer.prefetch(start + diff * p for p in curve)
 
         def tick():
-            if step[0] > steps:
+            if step[0] >= len(curve):
                 self._ring_anim_fraction = target_fraction
                 self._draw_timer_ring(target_fraction)
                 if callback:
                     callback()
                 return
-            t = ease_in_out_cubic(step[0] / steps)
-            current = start + diff * t
+            current = start + diff * curve[step[0]]
             self._ring_anim_fraction = current
             self._draw_timer_ring(current)
             step[0] += 1
-            self.after(16, tick)
+            self.after(frame_ms, tick)
 
         tick()
 
@@ -617,24 +1541,37 @@ class KittyTimerApp(tk.Tk):
             self.timer_paused = False
             self.timer_running = True
             self.pause_btn.set_text("⏸  Pause")
-            self._timer_tick()
+            self.start_btn.set_disabled(True)
+            deadline = time.monotonic() + self.timer_left
+            if self.timer_sequence is not None:
+                # Push the remaining boundaries back by the time spent paused
+                self.timer_sequence.shift(deadline - self.timer_sequence.deadline)
+            self._timer_arm(deadline)
+            self._checkpoint_timer()
             self._set_cat_state("alert")
             self._animate_text(self.timer_cat_text, "Counting down... stay focused! ᓚᘏᗢ")
             return
 
-        try:
-            h = int(self.timer_h.get())
-            m = int(self.timer_m.get())
-            s = int(self.timer_s.get())
-        except ValueError:
-            return
+        name = self._sequence_names[self._sequence_index]
+        if name is not None:
+            self.timer_sequence = TimerSequence(name, TIMER_SEQUENCES[name], time.monotonic())
+            total = self.timer_sequence.duration
+        else:
+            try:
+                h = int(self.timer_h.get())
+                m = int(self.timer_m.get())
+                s = int(self.timer_s.get())
+            except ValueError:
+                return
 
-        total = h * 3600 + m * 60 + s
-        if total <= 0:
-            return
+            total = h * 3600 + m * 60 + s
+            if total <= 0:
+                return
+            self.timer_sequence = None
 
         self.timer_total_seconds = total
         self.timer_remaining = total
+        self.timer_left = float(total)
         self.timer_running = True
         self.timer_paused = False
         self._ring_anim_fraction = 0.0
@@ -644,24 +1581,125 @@ class KittyTimerApp(tk.Tk):
         self.reset_btn.set_disabled(False)
 
         self._set_cat_state("alert")
-        self._animate_text(self.timer_cat_text, "Counting down... stay focused! ᓚᘏᗢ")
+        if self.timer_sequence is not None:
+            self._animate_text(self.timer_cat_text,
+                               f"{self.timer_sequence.name}: {self.timer_sequence.label} first ᓚᘏᗢ")
+            self._timer_arm(self.timer_sequence.deadline)
+        else:
+            self._animate_text(self.timer_cat_text, "Counting down... stay focused! ᓚᘏᗢ")
+            self._timer_arm(time.monotonic() + self.timer_left)
+        self._checkpoint_timer()
+
+    def _cycle_sequence(self):
+        if self.timer_running or self.timer_paused:
+            return
+        self._sequence_index = (self._sequence_index + 1) % len(self._sequence_names)
+        name = self._sequence_names[self._sequence_index]
+        if name is None:
+            self.sequence_btn.set_text("⏱  Single timer")
+        else:
+            mins = sum(sec for _, sec in TIMER_SEQUENCES[name]) // 60
+            self.sequence_btn.set_text(f"🍅  {name} ({mins // 60}h{mins % 60:02d})")
+
+    def _timer_arm(self, deadline):
+        """Run the countdown against the absolute monotonic ``deadline``.
+
+        Completion is one ``after`` at the deadline. Repaints are aligned to
+        the countdown's own second edges (deadline - n), not the wall clock's,
+        so the digits never lag the deadline and nothing accumulates drift.
+        """
+        self.timer_deadline = deadline
+        left = deadline - time.monotonic()
+        self.timer_deadline_wall = time.time() + left
+        self.timer_job = self.after(max(0, math.ceil(left * 1000)), self._timer_due)
         self._timer_tick()
 
+    def _timer_stop_clock(self):
+        if self.timer_job:
+            self.after_cancel(self.timer_job)
+            self.timer_job = None
+        if self.timer_tick_job:
+            self.after_cancel(self.timer_tick_job)
+            self.timer_tick_job = None
+
     def _timer_tick(self):
+        self.timer_tick_job = None
         if not self.timer_running:
             return
-        if self.timer_remaining <= 0:
-            self._timer_complete()
-            return
-
-        fraction = 1 - (self.timer_remaining / self.timer_total_seconds)
+        left = max(0.0, self.timer_deadline - time.monotonic())
+        self.timer_remaining = math.ceil(left)
+        fraction = 1 - (left / self.timer_total_seconds)
         self._ring_anim_fraction = fraction
         self._draw_timer_ring(fraction)
-        self.timer_remaining -= 1
-        self.timer_job = self.after(1000, self._timer_tick)
+        if self.timer_remaining > 1:
+            # Next repaint when the shown count drops to remaining - 1; the last
+            # one is left to _timer_due
+            until = left - (self.timer_remaining - 1)
+            self.timer_tick_job = self.after(math.ceil(until * 1000) + SecondTicker.EDGE_DELAY_MS,
+                                             self._timer_tick)
+            if self.ring_renderer is not None:
+                total = self.timer_total_seconds
+                self.ring_renderer.prefetch(1 - (left - until - i) / total for i in range(2))
+
+    def _timer_due(self):
+        left = self.timer_deadline - time.monotonic()
+        if left > 0.001:
+            # Tk timers may round down; wait out the remainder
+            self.timer_job = self.after(math.ceil(left * 1000), self._timer_due)
+            return
+        self.timer_job = None
+        seq = self.timer_sequence
+        if seq is not None and seq.index < len(seq) - 1:
+            self._sequence_boundary()
+        else:
+            self._timer_complete()
 
-    def _timer_complete(self):
+    def _sequence_boundary(self):
+        """Switch to the next phase; its deadline was fixed when the chain started."""
+        seq = self.timer_sequence
+        now_m = time.monotonic()
+        now = time.time()
+        self._record_timer_telemetry(now_m, now)
+        self.history.record(EVENT_TIMER, now - self._timer_lateness(now_m, seq.deadline), now,
+                            label=f"{seq.name}: {seq.label}", duration=seq.duration)
+        seq.advance(max(now_m, seq.deadline))
+        if seq.finished:
+            # Every remaining phase ran out at once; this boundary is already logged
+            self._timer_complete(recorded=True)
+            return
+        self.timer_total_seconds = seq.duration
+        self._timer_arm(seq.deadline)
+        self._checkpoint_timer()
+
+        focus = seq.label == "Focus"
+        self._set_cat_state("alert" if focus else "sleeping")
+        self._animate_text(self.timer_cat_text,
+                           "Back to focus! ᓚᘏᗢ" if focus else f"{seq.label}! Stretch those paws 😽")
+        self._play_alert()
+
+    def _timer_complete(self, recorded=False):
+        """Finish the countdown. History holds one event per phase, so the end of a
+        sequence logs only its last phase, and nothing when the caller already did."""
+        now_m = time.monotonic()
+        now = time.time()
+        late = max(0.0, now_m - self.timer_deadline)
+        seq = self.timer_sequence
+        if not recorded:
+            self._record_timer_telemetry(now_m, now)
+            if seq is not None:
+                phase, duration = f"{seq.name}: {seq.label}", seq.duration
+            else:
+                phase, duration = f"{self.timer_total_seconds}s timer", self.timer_total_seconds
+            self.history.record(EVENT_TIMER, now - self._timer_lateness(now_m, self.timer_deadline),
+                                now, label=phase, duration=duration)
+        label = f"{seq.name} sequence" if seq is not None else f"{self.timer_total_seconds}s timer"
+        self.hooks.fire("timer", label, now - late)
+        self.timer_sequence = None
+        self._timer_stop_clock()
         self.timer_running = False
+        self.timer_remaining = 0
+        self.timer_left = 0.0
+        self._checkpoint_timer()
         # Smooth ring fill to 100%
         self._animate_ring_to(1.0)
         self._set_cat_state("celebrate")
@@ -671,15 +1709,30 @@ class KittyTimerApp(tk.Tk):
 
         # Play sound
         for i in range(3):
-            self.after(i * 800, play_alert_sound)
+            self.after(i * 800, self._play_alert)
 
         # Sparkle explosion!
-        self.after(200, lambda: SparkleOverlay(self.timer_canvas, 115, 115).start())
-        self.after(600, lambda: SparkleOverlay(self.timer_canvas, 115, 115).start())
+        if PERF["sparkles"]:
+            for delay in (200, 600):
+                self.after(delay, lambda: SparkleOverlay(
+                    self.timer_canvas, self.geom.ring_c, self.geom.ring_c,
+                    count=PERF["sparkles"]).start())
 
         # Flash effect
         self._flash_timer(0)
 
+    def _timer_lateness(self, now_m, deadline):
+        """Lateness for history; zero for a deadline that passed while the app was down."""
+        if self.timer_deadline_wall is None:
+            return 0.0
+        return max(0.0, now_m - deadline)
+
+    def _record_timer_telemetry(self, now_m, now):
+        # No wall twin means the deadline passed while the app was not running
+        if self.timer_deadline_wall is not None:
+            self.telemetry.record("timer", self.timer_deadline, now_m,
+                                  self.timer_deadline_wall, now)
+
     def _flash_timer(self, count):
         if count >= 6:
             self.timer_canvas.configure(bg=PINK_PALE)
@@ -692,21 +1745,65 @@ class KittyTimerApp(tk.Tk):
         if self.timer_running and not self.timer_paused:
             self.timer_running = False
             self.timer_paused = True
-            if self.timer_job:
-                self.after_cancel(self.timer_job)
+            self.timer_left = max(0.0, self.timer_deadline - time.monotonic())
+            self._timer_stop_clock()
+            self._checkpoint_timer()
             self.pause_btn.set_text("▶  Resume")
             self.start_btn.set_disabled(False)
             self._animate_text(self.timer_cat_text, "Paused... take a break 😽")
         elif self.timer_paused:
             self._timer_start()
 
+    def _checkpoint_timer(self):
+        """Save the countdown as absolute deadlines; called on state changes only."""
+        self.checkpoint.save(capture(self.timer_running, self.timer_paused,
+                                     self.timer_deadline, self.timer_left,
+                                     self.timer_total_seconds, self.timer_sequence))
+
+    def _restore_timer(self):
+        """Pick up a countdown saved by a previous run.
+
+        A deadline that passed while the app was down is armed anyway, so it
+        fires straight away; the downtime is not counted as lateness.
+        """
+        state = self.checkpoint.load()
+        if state is None:
+            return
+        try:
+            running, deadline, left, total, seq = restore(state)
+        except (KeyError, TypeError, ValueError):
+            self.checkpoint.save(None)
+            return
+        self.timer_sequence = seq
+        self.timer_total_seconds = total
+        self.timer_left = left
+        self.timer_remaining = math.ceil(left)
+        self.start_btn.set_disabled(running)
+        self.pause_btn.set_disabled(False)
+        self.reset_btn.set_disabled(False)
+        if running:
+            self.timer_running = True
+            self._set_cat_state("alert")
+            self._animate_text(self.timer_cat_text, "Welcome back! Still counting ᓚᘏᗢ")
+            self._timer_arm(deadline)
+            if deadline <= time.monotonic():
+                self.timer_deadline_wall = None    # downtime, not scheduling lateness
+        else:
+            self.timer_paused = True
+            self.pause_btn.set_text("▶  Resume")
+            self._ring_anim_fraction = 1 - left / total if total else 0.0
+            self._draw_timer_ring(self._ring_anim_fraction)
+            self._animate_text(self.timer_cat_text, "Paused... take a break 😽")
+
     def _timer_reset(self):
         self.timer_running = False
         self.timer_paused = False
-        if self.timer_job:
-            self.after_cancel(self.timer_job)
+        self._timer_stop_clock()
+        self.timer_sequence = None
         self.timer_remaining = 0
+        self.timer_left = 0.0
         self.timer_total_seconds = 0
+        self._checkpoint_timer()
         # Smooth ring collapse
         self._animate_ring_to(0.0)
         self.start_btn.set_disabled(False)
@@ -723,12 +1820,14 @@ class KittyTimerApp(tk.Tk):
         parent = self.alarm_frame
 
         # ── Cat mascot on canvas ──
-        self.alarm_cat_canvas = tk.Canvas(parent, width=160, height=170,
+        self.alarm_cat_canvas = tk.Canvas(parent, width=self.geom.cat_w,
+                                          height=self.geom.cat_h,
                                           bg=PINK_PALE, highlightthickness=0)
         self.alarm_cat_canvas.pack(pady=(10, 0))
+        self.cat_sprites[self.alarm_cat_canvas] = CatSprite(self.alarm_cat_canvas, self.geom)
 
         self.alarm_cat_text = tk.Label(parent, text="Set an alarm and I'll meow! 🐾",
-                                       font=("Helvetica Neue", 11, "italic"),
+                                       font=FONTS.get(11, "italic"),
                                        fg=PINK_TEXT, bg=PINK_PALE)
         self.alarm_cat_text.pack(pady=(0, 6))
 
@@ -737,10 +1836,10 @@ class KittyTimerApp(tk.Tk):
                               highlightthickness=2)
         clock_card.pack(pady=(4, 10), padx=30, fill="x")
 
-        tk.Label(clock_card, text="Current Time", font=("Helvetica Neue", 10, "bold"),
+        tk.Label(clock_card, text="Current Time", font=FONTS.get(10, "bold"),
                  fg=GRAY_TEXT, bg=WHITE).pack(pady=(8, 0))
         self.clock_label = tk.Label(clock_card, text="--:--:-- --",
-                                    font=("Helvetica Neue", 36, "bold"),
+                                    font=FONTS.get(36, "bold"),
                                     fg=PINK_DARK, bg=WHITE)
         self.clock_label.pack(pady=(0, 8))
 
@@ -748,7 +1847,7 @@ class KittyTimerApp(tk.Tk):
         set_frame = tk.Frame(parent, bg=PINK_PALE)
         set_frame.pack(pady=(6, 4))
 
-        tk.Label(set_frame, text="Set Alarm:", font=("Helvetica Neue", 12, "bold"),
+        tk.Label(set_frame, text="Set Alarm:", font=FONTS.get(12, "bold"),
                  fg=DARK_TEXT, bg=PINK_PALE).grid(row=0, column=0, padx=(0, 8))
 
         self.alarm_h = tk.StringVar(value="12")
@@ -756,17 +1855,17 @@ class KittyTimerApp(tk.Tk):
         self.alarm_period = tk.StringVar(value="AM")
 
         h_sb = tk.Spinbox(set_frame, from_=1, to=12, textvariable=self.alarm_h,
-                          width=3, font=("Helvetica Neue", 16), justify="center",
+                          width=3, font=FONTS.get(16), justify="center",
                           wrap=True, bg=WHITE, fg=DARK_TEXT, buttonbackground=PINK_LIGHT,
                           relief="flat", bd=2, highlightbackground=PINK_LIGHT,
                           highlightcolor=PINK_MAIN)
         h_sb.grid(row=0, column=1, padx=2)
 
-        tk.Label(set_frame, text=":", font=("Helvetica Neue", 16, "bold"),
+        tk.Label(set_frame, text=":", font=FONTS.get(16, "bold"),
                  fg=DARK_TEXT, bg=PINK_PALE).grid(row=0, column=2)
 
         m_sb = tk.Spinbox(set_frame, from_=0, to=59, textvariable=self.alarm_m,
-                          width=3, font=("Helvetica Neue", 16), justify="center",
+                          width=3, font=FONTS.get(16), justify="center",
                           wrap=True, format="%02.0f",
                           bg=WHITE, fg=DARK_TEXT, buttonbackground=PINK_LIGHT,
                           relief="flat", bd=2, highlightbackground=PINK_LIGHT,
@@ -778,6 +1877,19 @@ class KittyTimerApp(tk.Tk):
                                          PINK_MAIN, width=60, height=36)
         self.period_btn.grid(row=0, column=4, padx=(8, 0))
 
+        # Repeat rule: mode toggle + argument entry (minutes or YYYY-MM-DD list)
+        tk.Label(set_frame, text="Repeat:", font=FONTS.get(11, "bold"),
+                 fg=DARK_TEXT, bg=PINK_PALE).grid(row=1, column=0, padx=(0, 8), pady=(6, 0))
+        self._repeat_index = 0
+        self.repeat_btn = AnimatedButton(set_frame, REPEAT_MODES[0][0], self._cycle_repeat,
+                                         PINK_LIGHT, fg_color=DARK_TEXT, width=100, height=30)
+        self.repeat_btn.grid(row=1, column=1, columnspan=3, pady=(6, 0))
+        self.repeat_arg = tk.StringVar(value="")
+        tk.Entry(set_frame, textvariable=self.repeat_arg, width=10,
+                 font=FONTS.get(11), bg=WHITE, fg=DARK_TEXT, relief="flat",
+                 highlightbackground=PINK_LIGHT, highlightcolor=PINK_MAIN,
+                 highlightthickness=2).grid(row=1, column=4, padx=(8, 0), pady=(6, 0))
+
         # Set alarm button
         set_btn_frame = tk.Frame(parent, bg=PINK_PALE)
         set_btn_frame.pack(pady=(6, 6))
@@ -787,14 +1899,15 @@ class KittyTimerApp(tk.Tk):
 
         # ── Alarm list ──
         tk.Label(parent, text="🔔  Active Alarms",
-                 font=("Helvetica Neue", 12, "bold"),
+                 font=FONTS.get(12, "bold"),
                  fg=DARK_TEXT, bg=PINK_PALE).pack(pady=(6, 2))
 
         list_container = tk.Frame(parent, bg=PINK_PALE)
         list_container.pack(fill="both", expand=True, padx=20, pady=(0, 10))
 
         self.alarm_canvas_list = tk.Canvas(list_container, bg=PINK_PALE,
-                                           highlightthickness=0, height=140)
+                                           highlightthickness=0,
+                                           height=self.geom.alarm_list_h)
         scrollbar = ttk.Scrollbar(list_container, orient="vertical",
                                   command=self.alarm_canvas_list.yview)
         self.alarm_list_frame = tk.Frame(self.alarm_canvas_list, bg=PINK_PALE)
@@ -810,7 +1923,7 @@ class KittyTimerApp(tk.Tk):
 
         self._no_alarm_label = tk.Label(self.alarm_list_frame,
                                          text="No alarms set yet 😴",
-                                         font=("Helvetica Neue", 11, "italic"),
+                                         font=FONTS.get(11, "italic"),
                                          fg=GRAY_TEXT, bg=PINK_PALE)
         self._no_alarm_label.pack(pady=20)
 
@@ -822,6 +1935,20 @@ class KittyTimerApp(tk.Tk):
             self.alarm_period.set("AM")
             self.period_btn.set_text("AM")
 
+    def _cycle_repeat(self):
+        self._repeat_index = (self._repeat_index + 1) % len(REPEAT_MODES)
+        self.repeat_btn.set_text(REPEAT_MODES[self._repeat_index][0])
+
+    def _build_repeat_rule(self, h, m, period):
+        """Build the recurrence rule for the selected repeat mode."""
+        _, kind, extra = REPEAT_MODES[self._repeat_index]
+        arg = self.repeat_arg.get().strip()
+        if kind == REPEAT_INTERVAL:
+            return make_repeat(kind, minutes=int(arg), start=interval_start(h, m, period))
+        if kind == REPEAT_DATES:
+            return make_repeat(kind, dates=[d for d in arg.split(",") if d.strip()])
+        return make_repeat(kind, **extra)
+
     def _add_alarm(self):
         try:
             h = int(self.alarm_h.get())
@@ -832,7 +1959,14 @@ class KittyTimerApp(tk.Tk):
             return
 
         period = self.alarm_period.get()
-        time_str = f"{h:02d}:{m:02d} {period}"
+        try:
+            repeat = self._build_repeat_rule(h, m, period)
+        except ValueError:
+            messagebox.showinfo("Kitty says...",
+                                "Repeat needs minutes (e.g. 15) or dates (YYYY-MM-DD, ...) 😿")
+            return
+
+        time_str = alarm_label(h, m, period, repeat)
 
         for a in self.alarms:
             if a["time"] == time_str:
@@ -840,8 +1974,10 @@ class KittyTimerApp(tk.Tk):
                 return
 
         self.alarm_counter += 1
-        alarm = {"time": time_str, "id": self.alarm_counter, "h": h, "m": m, "period": period}
+        alarm = {"time": time_str, "id": self.alarm_counter, "h": h, "m": m, "period": period,
+                 "repeat": repeat}
         self.alarms.append(alarm)
+        self.alarm_scheduler.add(alarm)
 
         self._no_alarm_label.pack_forget()
         self._render_alarm_item(alarm)
@@ -849,32 +1985,36 @@ class KittyTimerApp(tk.Tk):
         self._set_cat_state("alert", target="alarm")
         self._animate_text(self.alarm_cat_text, f"Alarm set for {time_str}! I'll meow! 🐾")
 
-    def _render_alarm_item(self, alarm):
-        """Create an alarm card with slide-in animation."""
+    def _render_alarm_item(self, alarm, animate=True):
+        """Create an alarm card, with a slide-in animation unless ``animate`` is off."""
         card = tk.Frame(self.alarm_list_frame, bg=WHITE, bd=0,
                         highlightbackground=PINK_LIGHT, highlightthickness=2)
         card.pack(fill="x", pady=3, padx=4)
         card.alarm_id = alarm["id"]
 
         tk.Label(card, text=f"⏰  {alarm['time']}",
-                 font=("Helvetica Neue", 14, "bold"),
+                 font=FONTS.get(14, "bold"),
                  fg=DARK_TEXT, bg=WHITE).pack(side="left", padx=(12, 0), pady=8)
 
         # Animated delete button
-        del_canvas = tk.Canvas(card, width=30, height=30, bg=WHITE, highlightthickness=0)
+        g = self.geom
+        dc, dr = g.del_c, g.del_r
+        del_canvas = tk.Canvas(card, width=g.del_size, height=g.del_size, bg=WHITE,
+                               highlightthickness=0)
         del_canvas.pack(side="right", padx=(0, 8), pady=6)
-        del_canvas.create_text(15, 15, text="✕", font=("Helvetica Neue", 14, "bold"),
+        del_canvas.create_text(dc, dc, text="✕", font=FONTS.get(14, "bold"),
                                fill=PINK_DARK)
 
         def on_del_enter(e):
             del_canvas.delete("all")
-            del_canvas.create_oval(2, 2, 28, 28, fill=PINK_LIGHT, outline="")
-            del_canvas.create_text(15, 15, text="✕", font=("Helvetica Neue", 14, "bold"),
+            del_canvas.create_oval(dc - dr, dc - dr, dc + dr, dc + dr,
+                                   fill=PINK_LIGHT, outline="")
+            del_canvas.create_text(dc, dc, text="✕", font=FONTS.get(14, "bold"),
                                    fill=PINK_ACCENT)
 
         def on_del_leave(e):
             del_canvas.delete("all")
-            del_canvas.create_text(15, 15, text="✕", font=("Helvetica Neue", 14, "bold"),
+            del_canvas.create_text(dc, dc, text="✕", font=FONTS.get(14, "bold"),
                                    fill=PINK_DARK)
 
         del_canvas.bind("<Enter>", on_del_enter)
@@ -884,20 +2024,22 @@ class KittyTimerApp(tk.Tk):
         del_canvas.config(cursor="hand2")
 
         # Slide-in animation (fade from right)
-        self._slide_in_widget(card)
+        if animate:
+            self._slide_in_widget(card)
 
     def _slide_in_widget(self, widget):
         """Animate widget sliding in from right with opacity-like effect."""
         # We simulate by briefly highlighting the background
         steps = [0]
-        total = 8
+        colors = compile_tween(ease_in_out_cubic, 240, 30, PINK_ACCENT, PINK_LIGHT)
 
         def tick():
-            if steps[0] > total:
+            if not widget.winfo_exists():
+                return  # card deleted mid-animation; let the chain die
+            if steps[0] >= len(colors):
                 widget.config(highlightbackground=PINK_LIGHT)
                 return
-            t = steps[0] / total
-            color = lerp_color(PINK_ACCENT, PINK_LIGHT, ease_in_out_cubic(t))
+            color = colors[steps[0]]
             widget.config(highlightbackground=color, highlightthickness=2)
             steps[0] += 1
             self.after(30, tick)
@@ -906,22 +2048,25 @@ class KittyTimerApp(tk.Tk):
         self.after(30, tick)
 
     def _delete_alarm(self, alarm_id, widget):
+        if getattr(widget, "deleting", False):
+            return  # already fading out; a second click would double-remove
+        widget.deleting = True
         # Fade-out animation
         self._fade_out_widget(widget, lambda: self._remove_alarm(alarm_id, widget))
 
     def _fade_out_widget(self, widget, callback):
         """Shrink/fade animation before removing."""
         steps = [0]
-        total = 6
+        colors = compile_tween(ease_in_out_cubic, 150, 25, WHITE, PINK_PALE)
+        borders = compile_tween(ease_linear, 150, 25, 2, 0)
 
         def tick():
-            if steps[0] > total:
+            if steps[0] >= len(colors):
                 callback()
                 return
-            t = steps[0] / total
-            color = lerp_color(WHITE, PINK_PALE, ease_in_out_cubic(t))
+            color = colors[steps[0]]
             try:
-                widget.config(bg=color, highlightthickness=max(0, int(2 * (1 - t))))
+                widget.config(bg=color, highlightthickness=int(borders[steps[0]]))
                 for child in widget.winfo_children():
                     try:
                         child.config(bg=color)
@@ -935,47 +2080,45 @@ class KittyTimerApp(tk.Tk):
         tick()
 
     def _remove_alarm(self, alarm_id, widget):
+        self.alarm_scheduler.remove(alarm_id)
         self.alarms = [a for a in self.alarms if a["id"] != alarm_id]
-        widget.destroy()
+        if widget.winfo_exists():
+            widget.destroy()
         if not self.alarms:
             self._no_alarm_label.pack(pady=20)
             self._set_cat_state("sleeping", target="alarm")
             self._animate_text(self.alarm_cat_text, "Set an alarm and I'll meow! 🐾")
 
-    # ── Alarm checker (background thread) ────────────────────────────────────
-    def _alarm_checker(self):
-        triggered = set()
-        while self.alarm_check_running:
-            now = time.localtime()
-            current_h = now.tm_hour
-            current_m = now.tm_min
-            current_s = now.tm_sec
-
-            for alarm in self.alarms[:]:
-                ah = alarm["h"]
-                if alarm["period"] == "AM":
-                    if ah == 12:
-                        ah = 0
-                else:
-                    if ah != 12:
-                        ah += 12
-
-                key = f"{alarm['id']}_{ah}_{alarm['m']}"
-                if current_h == ah and current_m == alarm["m"] and current_s < 2:
-                    if key not in triggered:
-                        triggered.add(key)
-                        self.after(0, self._alarm_triggered, alarm)
-                else:
-                    triggered.discard(key)
-
-            time.sleep(0.5)
-
-    def _alarm_triggered(self, alarm):
+    # ── Alarm scheduler callback (scheduler thread) ──────────────────────────
+    def _on_alarm_due(self, alarm, deadline, due_mono=None):
+        # Scheduler thread: hooks are queued from here so Tk never waits on them
+        self.hooks.fire("alarm", alarm["time"], deadline, alarm)
+        self.after(0, self._alarm_triggered, alarm, deadline, due_mono)
+
+    def _on_hook_result(self, hook, events, latency, error):
+        # Hook worker thread; failures are logged and kept in hooks.report()
+        if error is not None:
+            print(f"🐱 hook {hook.key} failed after {latency * 1000:.0f} ms: {error}",
+                  file=sys.stderr)
+
+    def _alarm_triggered(self, alarm, deadline=None, due_mono=None):
+        now_m = time.monotonic()
+        now = time.time()
+        self.telemetry.record("alarm", due_mono, now_m, deadline, now)
+        self.history.record(EVENT_ALARM, deadline or now, now, label=alarm["time"])
+
+        # One-shot and exhausted date alarms leave the list once they fire
+        if not self.alarm_scheduler.is_scheduled(alarm["id"]):
+            for card in self.alarm_list_frame.winfo_children():
+                if getattr(card, "alarm_id", None) == alarm["id"]:
+                    self._remove_alarm(alarm["id"], card)
+                    break
+
         self._set_cat_state("celebrate", target="alarm")
         self._animate_text(self.alarm_cat_text, f"🔔 MEOW! It's {alarm['time']}! 🔔")
 
         for i in range(5):
-            self.after(i * 600, play_alert_sound)
+            self.after(i * 600, self._play_alert)
 
         self._flash_clock(0)
 
@@ -997,11 +2140,90 @@ class KittyTimerApp(tk.Tk):
         self.clock_label.configure(fg=color)
         self.after(200, self._flash_clock, count + 1)
 
-    # ── Live clock with smooth colon blink ───────────────────────────────────
-    def _update_clock(self):
-        now = time.strftime("%I:%M:%S %p")
-        self.clock_label.config(text=now)
-        self.after(500, self._update_clock)
+    # ── Live clock (driven by the second ticker) ─────────────────────────────
+    def _update_clock(self, second=None):
+        now = time.localtime(second)
+        self.clock_label.config(text=time.strftime("%I:%M:%S %p", now))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    #  STOPWATCH TAB
+    # ═══════════════════════════════════════════════════════════════════════════
+    def _build_stopwatch_tab(self):
+        parent = self.stopwatch_frame
+
+        g = self.geom
+        self.sw_canvas = tk.Canvas(parent, width=g.sw_w, height=g.sw_h,
+                                   bg=PINK_PALE, highlightthickness=0)
+        self.sw_canvas.pack(pady=(24, 4))
+        self._sw_title_item = self.sw_canvas.create_text(
+            g.sw_w // 2, g.sw_title_y, text="Stopwatch", font=FONTS.get(12, "bold"),
+            fill=PINK_TEXT)
+        self._sw_time_item = self.sw_canvas.create_text(
+            g.sw_w // 2, g.sw_time_y, text=format_ns(0), font=FONTS.get(36, "bold"),
+            fill=PINK_DARK)
+
+        btn_frame = tk.Frame(parent, bg=PINK_PALE)
+        btn_frame.pack(pady=(4, 12))
+        self.sw_start_btn = AnimatedButton(btn_frame, "▶  Start", self._sw_toggle,
+                                           PINK_MAIN, width=120, height=42)
+        self.sw_start_btn.grid(row=0, column=0, padx=6)
+        self.sw_lap_btn = AnimatedButton(btn_frame, "⚑  Lap", self._sw_lap, PINK_LIGHT,
+                                         fg_color=DARK_TEXT, width=120, height=42)
+        self.sw_lap_btn.grid(row=0, column=1, padx=6)
+        self.sw_lap_btn.set_disabled(True)
+        self.sw_reset_btn = AnimatedButton(btn_frame, "↺  Reset", self._sw_reset, PINK_LIGHT,
+                                           fg_color=DARK_TEXT, width=120, height=42)
+        self.sw_reset_btn.grid(row=0, column=2, padx=6)
+        self.sw_reset_btn.set_disabled(True)
+
+        tk.Label(parent, text="⚑  Laps", font=FONTS.get(12, "bold"),
+                 fg=DARK_TEXT, bg=PINK_PALE).pack(pady=(6, 2))
+        self.sw_lap_list = VirtualLapList(parent, self.stopwatch.laps, height=260)
+        self.sw_lap_list.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+    def _sw_toggle(self):
+        sw = self.stopwatch
+        if sw.running:
+            sw.stop()
+            if self._sw_job:
+                self.after_cancel(self._sw_job)
+                self._sw_job = None
+            self._sw_refresh()
+            self.sw_start_btn.set_text("▶  Start")
+            self.sw_lap_btn.set_disabled(True)
+        else:
+            sw.start()
+            self.sw_start_btn.set_text("⏸  Stop")
+            self.sw_lap_btn.set_disabled(False)
+            self.sw_reset_btn.set_disabled(False)
+            self._sw_loop()
+
+    def _sw_lap(self):
+        if self.stopwatch.lap() is not None:
+            self.sw_lap_list.first = 0
+            self.sw_lap_list.refresh()
+
+    def _sw_reset(self):
+        if self._sw_job:
+            self.after_cancel(self._sw_job)
+            self._sw_job = None
+        self.stopwatch.reset()
+        self._sw_refresh()
+        self.sw_lap_list.refresh()
+        self.sw_start_btn.set_text("▶  Start")
+        self.sw_lap_btn.set_disabled(True)
+        self.sw_reset_btn.set_disabled(True)
+
+    def _sw_loop(self):
+        self._sw_refresh()
+        self._sw_job = self.after(PERF["frame_ms"], self._sw_loop)
+
+    def _sw_refresh(self):
+        """Reconfigure the time text item, and only when the 10 ms digit changed."""
+        text = format_ns(self.stopwatch.elapsed_ns())
+        if text != self._sw_text:
+            self._sw_text = text
+            self.sw_canvas.itemconfig(self._sw_time_item, text=text)
 
     # ═══════════════════════════════════════════════════════════════════════════
     #  CAT MASCOT ANIMATIONS
@@ -1010,111 +2232,386 @@ class KittyTimerApp(tk.Tk):
         """Change cat state with a bounce transition."""
         self._cat_current_state = state
         canvas = self.timer_cat_canvas if target == "timer" else self.alarm_cat_canvas
-        self._bounce_cat(canvas, state)
+        if PERF["bounce"]:
+            self._bounce_cat(canvas, state)
+        else:
+            self._draw_cat_on_canvas(canvas, state)
 
-    def _bounce_cat(self, canvas, state, step=0, total=15):
+    def _bounce_cat(self, canvas, state, step=0):
         """Bounce/scale animation when cat changes state."""
-        if step > total:
+        # Elastic-style bounce, translated to a y-offset (bounce up then settle)
+        offsets = compile_tween(ease_out_elastic, 375, 25, -self.geom.cat_bounce, 0)
+        if step >= len(offsets):
             # Final draw at normal size
             self._draw_cat_on_canvas(canvas, state, offset_y=0, use_small=False)
             return
 
-        t = step / total
-        # Elastic-style bounce
-        scale = ease_out_elastic(t)
-        # Translate scale to y-offset (bounce up then settle)
-        offset_y = -15 * (1 - scale)
-        use_small = t < 0.3
-
-        self._draw_cat_on_canvas(canvas, state, offset_y=offset_y, use_small=use_small)
-        self.after(25, self._bounce_cat, canvas, state, step + 1, total)
+        use_small = step < 0.3 * (len(offsets) - 1)
+        self._draw_cat_on_canvas(canvas, state, offset_y=offsets[step], use_small=use_small)
+        self.after(25, self._bounce_cat, canvas, state, step + 1)
 
     def _draw_cat_on_canvas(self, canvas, state, offset_y=0, use_small=False):
-        """Draw the cat image on the given canvas."""
-        canvas.delete("all")
+        """Show the cat for ``state`` on the given canvas."""
         img_dict = self.cat_images_small if use_small else self.cat_images
-        img = img_dict.get(state)
-        if img:
-            canvas.create_image(80, 85 + offset_y, image=img, anchor="center")
-        else:
-            fallback = {"sleeping": "😴🐱", "alert": "😺🐱", "celebrate": "🎉🐱✨"}
-            canvas.create_text(80, 85 + offset_y, text=fallback.get(state, "🐱"),
-                               font=("Helvetica Neue", 40))
+        sprite = self.cat_sprites[canvas]
+        sprite.show(img_dict.get(state), state, offset_y)
+        if state != "sleeping":
+            sprite.set_zzz(None)
+        if state != "celebrate":
+            sprite.set_sparkles(())
 
     def _animate_cat_idle(self):
         """Subtle bobbing animation for the cat when idle."""
-        self._cat_bob_phase += 0.08
-        offset_y = math.sin(self._cat_bob_phase) * 4  # gentle 4px bob
+        idle_ms = PERF["idle_ms"]
+        self._cat_bob_phase += 0.08 * idle_ms / 50
+        g = self.geom
+        offset_y = math.sin(self._cat_bob_phase) * g.cat_bob if PERF["idle_bob"] else 0
+        state = self._cat_current_state
+
+        # Floating "zzZ" glyphs for sleeping state (shared by both cats)
+        zzz = None
+        if state == "sleeping" and PERF["zzz"]:
+            z_phase = (self._cat_bob_phase * 2) % (2 * math.pi)
+            zzz = []
+            for i in range(3):
+                zx = g.zzz_x + i * g.zzz_dx + math.sin(z_phase + i) * g.zzz_wobble
+                zy = g.zzz_y - i * g.zzz_dy + math.cos(z_phase + i * 0.5) * 3
+                alpha_t = (math.sin(z_phase + i * 1.2) + 1) / 2
+                zzz.append((zx, zy, lerp_color(PINK_LIGHT, PINK_ACCENT, alpha_t * 0.5)))
 
         # Only animate idle cats (sleeping or alert, not mid-bounce)
-        for canvas, target in [(self.timer_cat_canvas, "timer"),
-                               (self.alarm_cat_canvas, "alarm")]:
-            state = self._cat_current_state
-            img = self.cat_images.get(state)
-            if img:
-                canvas.delete("all")
-                canvas.create_image(80, 85 + offset_y, image=img, anchor="center")
-
-                # Add floating "zzZ" particles for sleeping state
-                if state == "sleeping":
-                    z_phase = (self._cat_bob_phase * 2) % (2 * math.pi)
-                    for i, char in enumerate(["z", "Z", "z"]):
-                        zx = 130 + i * 10 + math.sin(z_phase + i) * 5
-                        zy = 40 - i * 14 + math.cos(z_phase + i * 0.5) * 3
-                        alpha_t = (math.sin(z_phase + i * 1.2) + 1) / 2
-                        color = lerp_color(PINK_LIGHT, PINK_ACCENT, alpha_t * 0.5)
-                        canvas.create_text(zx, zy, text=char,
-                                           font=("Helvetica Neue", 10 + i * 2, "bold"),
-                                           fill=color)
-
-                # Add sparkle particles for celebrate state
-                if state == "celebrate":
-                    for i in range(5):
-                        sx = random.randint(10, 150)
-                        sy = random.randint(10, 150)
-                        ss = random.randint(2, 5)
-                        sc = random.choice(["#FFD700", "#FF69B4", "#FF1493", "#FFC0CB"])
-                        canvas.create_oval(sx - ss, sy - ss, sx + ss, sy + ss,
-                                           fill=sc, outline="")
-
-        self.after(50, self._animate_cat_idle)
+        img = self.cat_images.get(state)
+        for canvas in (self.timer_cat_canvas, self.alarm_cat_canvas):
+            if img is None:
+                break
+            sprite = self.cat_sprites[canvas]
+            sprite.show(img, state, offset_y)
+            sprite.set_zzz(zzz)
+
+            # Sparkle dots for celebrate state
+            dots = ()
+            if state == "celebrate":
+                dots = [(random.randint(g.sparkle_lo, g.sparkle_hi),
+                         random.randint(g.sparkle_lo, g.sparkle_hi),
+                         random.randint(g.sparkle_r_lo, g.sparkle_r_hi),
+                         random.choice(SPARKLE_COLORS))
+                        for _ in range(PERF["cat_sparkles"])]
+            sprite.set_sparkles(dots)
+
+        self._cat_idle_job = self.after(idle_ms, self._animate_cat_idle)
 
     # ═══════════════════════════════════════════════════════════════════════════
     #  TEXT ANIMATIONS
     # ═══════════════════════════════════════════════════════════════════════════
     def _animate_text(self, label, new_text):
         """Typewriter-style text reveal with color fade."""
-        label.config(text="")
-        step = [0]
-        total = len(new_text)
-
-        def tick():
-            if step[0] > total:
-                label.config(fg=PINK_TEXT)
-                return
-            displayed = new_text[:step[0]]
-            label.config(text=displayed)
-            # Color transition during typing
-            t = step[0] / max(total, 1)
-            color = lerp_color(PINK_ACCENT, PINK_TEXT, ease_in_out_cubic(t))
-            label.config(fg=color)
-            step[0] += 1
-            speed = max(15, 40 - total)  # faster for longer texts
-            self.after(speed, tick)
-
-        tick()
+        self.text_animator.animate(label, new_text)
 
     # ═══════════════════════════════════════════════════════════════════════════
     #  HELPERS
     # ═══════════════════════════════════════════════════════════════════════════
+    def _show_stats(self):
+        """Small window with the running history stats and recent events."""
+        if self._stats_window is not None and self._stats_window.winfo_exists():
+            self._stats_window.destroy()
+        win = tk.Toplevel(self, bg=PINK_PALE)
+        win.title("📊 Kitty Stats")
+        self._stats_window = win
+
+        st = self.history.stats
+        hrs, rem = divmod(st.timer_seconds, 3600)
+        lines = [
+            f"Timers completed:  {st.timers}   ({hrs}h {rem // 60}m total)",
+            f"Alarms fired:      {st.alarms}",
+            f"Streak:            {st.streak} day(s)   (best {st.best_streak})",
+            f"Avg lateness:      {st.avg_lateness * 1000:.0f} ms   (max {st.late_max * 1000:.0f} ms)",
+        ]
+        tk.Label(win, text="\n".join(lines), font=FONTS.get(11), justify="left",
+                 fg=DARK_TEXT, bg=PINK_PALE).pack(padx=18, pady=(14, 8), anchor="w")
+
+        tk.Label(win, text="Recent", font=FONTS.get(11, "bold"),
+                 fg=PINK_TEXT, bg=PINK_PALE).pack(anchor="w", padx=18)
+        recent = list(self.history.recent)[-10:][::-1]
+        rows = [f"{time.strftime('%b %d %I:%M %p', time.localtime(actual))}  "
+                f"{EVENT_NAMES[kind]:<5}  {label}  (+{late * 1000:.0f} ms)"
+                for kind, actual, late, _, label in recent] or ["Nothing yet 😴"]
+        tk.Label(win, text="\n".join(rows), font=FONTS.get(10), justify="left",
+                 fg=GRAY_TEXT, bg=PINK_PALE).pack(padx=18, pady=(2, 14), anchor="w")
+
+        acc = self.telemetry.summary()
+        rows = [f"{key:<15} p50 {st['p50_ms']:6.1f}  p99 {st['p99_ms']:6.1f}  "
+                f"max {st['max_ms']:7.1f} ms   ({st['count']})"
+                for key, st in acc.items() if st["count"]]
+        if rows:
+            tk.Label(win, text="Accuracy", font=FONTS.get(11, "bold"),
+                     fg=PINK_TEXT, bg=PINK_PALE).pack(anchor="w", padx=18)
+            tk.Label(win, text="\n".join(rows), font=FONTS.get(10), justify="left",
+                     fg=GRAY_TEXT, bg=PINK_PALE).pack(padx=18, pady=(2, 14), anchor="w")
+
+        if self.ring_renderer is not None:
+            served, hit, ahead = self.ring_renderer.stats()
+            if served:
+                tk.Label(win, text=f"Ring frames: {served} drawn, {hit:.0%} cached, "
+                                   f"{ahead:.0%} prefetched, {1 - hit - ahead:.0%} rendered in place",
+                         font=FONTS.get(10), fg=GRAY_TEXT, bg=PINK_PALE
+                         ).pack(padx=18, pady=(0, 14), anchor="w")
+
+        report = self.hooks.report()
+        if report or self.hooks.problems:
+            tk.Label(win, text="Hooks", font=FONTS.get(11, "bold"),
+                     fg=PINK_TEXT, bg=PINK_PALE).pack(anchor="w", padx=18)
+            rows = [f"{key[:40]}  {st['runs']} run(s), {st['failures']} failed, "
+                    f"{st['coalesced']} coalesced, {st['dropped']} dropped, "
+                    f"avg {st['run_avg_ms']:.0f} ms"
+                    + (f"\n    last error: {st['last_error']}" if st["last_error"] else "")
+                    for key, st in report.items()]
+            rows += [f"skipped {problem}" for problem in self.hooks.problems[-5:]]
+            tk.Label(win, text="\n".join(rows), font=FONTS.get(10), justify="left",
+                     fg=GRAY_TEXT, bg=PINK_PALE).pack(padx=18, pady=(2, 14), anchor="w")
+
+    def _play_alert(self):
+        if not self.muted:
+            play_alert_sound()
+
+    def _on_profile_done(self, path, samples):
+        # Runs on the profiler thread: report only, no Tk calls
+        print(f"🐱 profile: {samples} samples -> {path}", file=sys.stderr)
+
+    def _dump_telemetry(self):
+        path = self.telemetry.dump()
+        print(format_summary(self.telemetry.summary()))
+        if path:
+            print(f"🐱 telemetry written to {path}")
+
     def _on_close(self):
-        self.alarm_check_running = False
+        self.alarm_scheduler.stop()
+        self.hooks.close(timeout=0)
+        if self.ring_renderer is not None:
+            self.ring_renderer.close()
+        self.telemetry.dump()
+        self.history.close()
         self.destroy()
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Diagnostics
+# ═══════════════════════════════════════════════════════════════════════════════
+def _pump(app, duration):
+    """Run the Tk event loop by hand for ``duration`` seconds."""
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        app.update()
+        time.sleep(0.002)
+
+
+def measure_idle_wakeups(seconds=5.0, settle=2.0):
+    """Count Tk ``after`` callbacks per second for an idle app in each profile."""
+    orig_after = tk.Misc.after
+    fired = [0]
+
+    def counting_after(widget, ms, func=None, *args):
+        if func is None:
+            return orig_after(widget, ms)
+
+        def wrapped(*a):
+            fired[0] += 1
+            return func(*a)
+
+        return orig_after(widget, ms, wrapped, *args)
+
+    import tempfile
+
+    results = {}
+    tk.Misc.after = counting_after
+    try:
+        for name in PERF_PROFILES:
+            # A scratch history dir: no stale checkpoint to restore, nothing written to ~
+            with tempfile.TemporaryDirectory() as tmp:
+                app = KittyTimerApp(profile=name, history_dir=tmp)
+                _pump(app, settle)  # let startup transitions finish
+                fired[0] = 0
+                _pump(app, seconds)
+                results[name] = fired[0] / seconds
+                app._on_close()
+    finally:
+        tk.Misc.after = orig_after
+    return results
+
+
+def bench_tweens(repeat=2000):
+    """Per-frame cost of computing each effect live vs. reading its keyframe table."""
+    import timeit
+
+    effects = [
+        ("button fade", ease_in_out_cubic, 200, 16, PINK_MAIN, PINK_BTN_HOVER),
+        ("ring fill", ease_in_out_cubic, 800, 16, 0.0, 1.0),
+        ("cat bounce", ease_out_elastic, 375, 25, -15, 0),
+        ("card slide-in", ease_in_out_cubic, 240, 30, PINK_ACCENT, PINK_LIGHT),
+        ("card fade-out", ease_in_out_cubic, 150, 25, WHITE, PINK_PALE),
+    ]
+    results = []
+    for name, easing, duration, frame_ms, start, end in effects:
+        steps = max(1, duration // frame_ms)
+        if isinstance(start, str):
+            def live():
+                for i in range(steps + 1):
+                    lerp_color(start, end, easing(i / steps))
+        else:
+            def live():
+                for i in range(steps + 1):
+                    start + (end - start) * easing(i / steps)
+
+        def table():
+            frames = compile_tween(easing, duration, frame_ms, start, end)
+            for i in range(len(frames)):
+                frames[i]
+
+        frames = steps + 1
+        live_ns = timeit.timeit(live, number=repeat) / (repeat * frames) * 1e9
+        table_ns = timeit.timeit(table, number=repeat) / (repeat * frames) * 1e9
+        results.append((name, frames, live_ns, table_ns))
+    return results
+
+
+def _live_counts(app):
+    """(widgets, Tcl commands, pending after events) for a running app."""
+    widgets, stack = 0, [app]
+    while stack:
+        w = stack.pop()
+        widgets += 1
+        stack.extend(w.winfo_children())
+    commands = len(app.tk.splitlist(app.tk.call("info", "commands")))
+    pending = len(app.tk.splitlist(app.tk.call("after", "info")))
+    return widgets, commands, pending
+
+
+def run_soak(alarms=10000, cycles=2000, batch=100, memory_budget_kb=512,
+             widget_budget=0, command_budget=16):
+    """Churn alarms and timer cycles, then fail if steady-state usage grew.
+
+    Returns a list of budget violations (empty when everything stayed flat).
+    """
+    import gc
+    import tempfile
+    import tracemalloc
+
+    scratch = tempfile.TemporaryDirectory()   # history, checkpoint and telemetry
+    app = KittyTimerApp(profile="low-power", history_dir=scratch.name)
+    try:
+        app.muted = True
+
+        def alarm_batch(n):
+            for i in range(n):
+                app.alarm_h.set(str(1 + (i // 60) % 12))
+                app.alarm_m.set(str(i % 60))
+                app._add_alarm()
+            for card in list(app.alarm_list_frame.winfo_children()):
+                if hasattr(card, "alarm_id"):
+                    app._delete_alarm(card.alarm_id, card)
+            _pump(app, 0.25)
+
+        def timer_batch(n):
+            for _ in range(n):
+                app.timer_h.set("0")
+                app.timer_m.set("0")
+                app.timer_s.set("1")
+                app._timer_start()
+                # Fire by hand; the armed completion job must not run again later
+                app._timer_stop_clock()
+                app.timer_deadline = time.monotonic()
+                app._timer_due()
+                app._timer_reset()
+            _pump(app, 1.0)
+
+        # Warm up caches (fonts, ring frames, images) before the baseline
+        alarm_batch(batch)
+        timer_batch(batch)
+        _pump(app, 1.0)
+        gc.collect()
+        tracemalloc.start()
+        base_mem = tracemalloc.get_traced_memory()[0]
+        base = _live_counts(app)
+
+        for _ in range(max(1, alarms // batch)):
+            alarm_batch(batch)
+        for _ in range(max(1, cycles // batch)):
+            timer_batch(batch)
+        _pump(app, 1.5)
+        gc.collect()
+
+        grown_kb = (tracemalloc.get_traced_memory()[0] - base_mem) / 1024
+        tracemalloc.stop()
+        after = _live_counts(app)
+        heap = len(app.alarm_scheduler._heap)
+    finally:
+        app._on_close()
+        scratch.cleanup()
+
+    print(f"memory   {grown_kb:+9.1f} KiB   (budget {memory_budget_kb} KiB)")
+    for name, b, a in zip(("widgets", "commands", "after"), base, after):
+        print(f"{name:<8} {b:6d} -> {a:6d}")
+    print(f"alarm heap entries left: {heap}")
+
+    failures = []
+    if grown_kb > memory_budget_kb:
+        failures.append(f"traced memory grew {grown_kb:.0f} KiB")
+    if after[0] - base[0] > widget_budget:
+        failures.append(f"{after[0] - base[0]} widgets leaked")
+    if after[1] - base[1] > command_budget:
+        failures.append(f"{after[1] - base[1]} Tcl commands leaked")
+    if heap > 64:
+        failures.append(f"{heap} scheduler heap entries left behind")
+    return failures
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Entry Point
 # ═══════════════════════════════════════════════════════════════════════════════
-if __name__ == "__main__":
-    app = KittyTimerApp()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🐱 Kitty Timer & Alarm")
+    parser.add_argument("--profile", choices=list(PERF_PROFILES), default="full",
+                        help="animation/performance profile")
+    parser.add_argument("--ring", choices=["image", "tk"], default="image",
+                        help="progress ring backend: cached PIL frames or Tk arcs")
+    parser.add_argument("--ring-cache-mb", type=float, default=None,
+                        help="memory cap for ring frames, image backend "
+                             "(default: 32 MB times the UI scale squared)")
+    parser.add_argument("--history-dir", default=DEFAULT_DIR,
+                        help="where the history log and stats are kept")
+    parser.add_argument("--scale", type=float, default=None,
+                        help="UI scale factor (default: from screen DPI, or $KITTY_SCALE)")
+    parser.add_argument("--profile-seconds", type=float, default=10.0,
+                        help="length of a SIGUSR1 / Ctrl+Alt+P profiler capture")
+    parser.add_argument("--soak", action="store_true",
+                        help="churn 10k alarms and 2k timer cycles, fail on memory/widget growth")
+    parser.add_argument("--bench-tweens", action="store_true",
+                        help="print per-frame cost of live easing vs. compiled tween tables")
+    parser.add_argument("--measure-wakeups", action="store_true",
+                        help="print idle wakeups per second for each profile and exit")
+    args = parser.parse_args(argv)
+
+    if args.soak:
+        failures = run_soak()
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1 if failures else 0)
+
+    if args.bench_tweens:
+        print(f"{'effect':<14} {'frames':>6} {'live ns/frame':>14} {'table ns/frame':>15}")
+        for name, frames, live_ns, table_ns in bench_tweens():
+            print(f"{name:<14} {frames:>6} {live_ns:>14.0f} {table_ns:>15.0f}")
+        return
+
+    if args.measure_wakeups:
+        for name, rate in measure_idle_wakeups().items():
+            print(f"{name:>10}: {rate:6.1f} wakeups/s")
+        return
+
+    app = KittyTimerApp(profile=args.profile, ring_backend=args.ring,
+                        ring_cache_mb=args.ring_cache_mb, history_dir=args.history_dir,
+                        scale=args.scale, profile_seconds=args.profile_seconds)
     app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+🐱 Kitty Timer — checkpoints
+Running and paused countdowns saved as absolute wall-clock deadlines, so a
+restarted process picks them up again, or fires the ones that expired while
+it was down.
+"""
+
+import json
+import os
+import time
+
+from history import DEFAULT_DIR
+from scheduler import TimerSequence
+
+VERSION = 1
+
+
+def capture(running, paused, deadline, left, total, sequence=None):
+    """Checkpoint dict for the current countdown, or None when nothing is running.
+
+    ``deadline`` and the sequence boundaries are monotonic; they are stored as
+    epoch seconds, since the monotonic clock does not survive a restart.
+    """
+    if not (running or paused):
+        return None
+    offset = time.time() - time.monotonic()
+    state = {"version": VERSION, "status": "running" if running else "paused",
+             "total": total}
+    if running:
+        state["deadline"] = deadline + offset
+    else:
+        state["left"] = left
+    if sequence is not None:
+        state["sequence"] = {
+            "name": sequence.name,
+            "phases": list(zip(sequence.labels, sequence.durations)),
+            "ends": [end + offset for end in sequence.ends],
+            "index": sequence.index,
+        }
+    return state
+
+
+def restore(state):
+    """Convert a loaded checkpoint back to monotonic time.
+
+    Returns ``(running, deadline, left, total, sequence)``; ``deadline`` may
+    already be in the past, in which case the caller should fire at once.
+    """
+    offset = time.monotonic() - time.time()
+    seq = state.get("sequence")
+    if seq is not None:
+        seq = TimerSequence.restore(seq["name"], [tuple(p) for p in seq["phases"]],
+                                    [end + offset for end in seq["ends"]], seq["index"])
+    if state["status"] == "running":
+        deadline = state["deadline"] + offset
+        return True, deadline, max(0.0, deadline - time.monotonic()), state["total"], seq
+    return False, None, state["left"], state["total"], seq
+
+
+def same_state(a, b, slack=0.05):
+    """True if two checkpoints differ at most by clock-offset jitter.
+
+    ``capture`` reads both clocks to convert deadlines, so the same monotonic
+    deadline comes out a few microseconds apart in epoch time on every call.
+    """
+    if a is None or b is None:
+        return a is b
+    a, b = dict(a), dict(b)
+    times_a = [a.pop("deadline", 0.0)]
+    times_b = [b.pop("deadline", 0.0)]
+    if "sequence" in a and "sequence" in b:
+        a["sequence"], b["sequence"] = dict(a["sequence"]), dict(b["sequence"])
+        times_a += a["sequence"].pop("ends")
+        times_b += b["sequence"].pop("ends")
+    return (a == b and len(times_a) == len(times_b)
+            and all(abs(x - y) <= slack for x, y in zip(times_a, times_b)))
+
+
+class TimerCheckpoint:
+    """One small JSON file, replaced atomically on every state change.
+
+    Callers save on start, pause, resume, phase change, completion and reset
+    only, never per tick; an unchanged state is not rewritten.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, "timer_state.json")
+        self._last = self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("version") == VERSION else None
+
+    def save(self, state):
+        """Persist ``state`` (from ``capture``), or remove the file for None."""
+        if same_state(state, self._last):
+            return
+        try:
+            if state is None:
+                os.remove(self.path)
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump(state, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        self._last = state
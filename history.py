@@ -0,0 +1,204 @@
+"""
+🐱 Kitty Timer — history
+Completed-timer / fired-alarm log: in-memory ring, batched background writes
+to a rotating binary log, and incrementally maintained stats.
+"""
+
+import collections
+import datetime
+import json
+import os
+import struct
+import threading
+import time
+
+EVENT_TIMER = 1
+EVENT_ALARM = 2
+EVENT_NAMES = {EVENT_TIMER: "timer", EVENT_ALARM: "alarm"}
+
+# kind, actual wall time, lateness (ms), duration (s), label length — then label bytes
+RECORD = struct.Struct("<BdiIB")
+INT32_MAX = 2 ** 31 - 1     # lateness saturates at ~24.8 days
+UINT32_MAX = 2 ** 32 - 1
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".kitty_timer")
+
+
+def read_log(path):
+    """Yield ``(kind, actual, lateness_s, duration_s, label)`` from one log file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while pos + RECORD.size <= len(data):
+        kind, actual, late_ms, duration, n = RECORD.unpack_from(data, pos)
+        pos += RECORD.size
+        label = data[pos:pos + n].decode("utf-8", "replace")
+        pos += n
+        yield kind, actual, late_ms / 1000, duration, label
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Stats
+# ═══════════════════════════════════════════════════════════════════════════════
+class HistoryStats:
+    """Running totals updated per event; never rebuilt from the log."""
+
+    FIELDS = ("timers", "alarms", "timer_seconds", "late_sum", "late_count",
+              "late_max", "streak", "best_streak", "last_day")
+
+    def __init__(self):
+        self.timers = 0
+        self.alarms = 0
+        self.timer_seconds = 0
+        self.late_sum = 0.0
+        self.late_count = 0
+        self.late_max = 0.0
+        self.streak = 0          # consecutive days with at least one event
+        self.best_streak = 0
+        self.last_day = None     # ISO date of the most recent event
+
+    def add(self, kind, actual, lateness, duration):
+        if kind == EVENT_TIMER:
+            self.timers += 1
+            self.timer_seconds += duration
+        else:
+            self.alarms += 1
+        self.late_sum += lateness
+        self.late_count += 1
+        self.late_max = max(self.late_max, lateness)
+
+        day = datetime.date.fromtimestamp(actual)
+        last = datetime.date.fromisoformat(self.last_day) if self.last_day else None
+        if last != day:
+            if last is not None and day - last == datetime.timedelta(days=1):
+                self.streak += 1
+            else:
+                self.streak = 1
+            self.best_streak = max(self.best_streak, self.streak)
+            self.last_day = day.isoformat()
+
+    @property
+    def avg_lateness(self):
+        return self.late_sum / self.late_count if self.late_count else 0.0
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for k in cls.FIELDS:
+            if k in data:
+                setattr(stats, k, data[k])
+        return stats
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  History Log
+# ═══════════════════════════════════════════════════════════════════════════════
+class HistoryLog:
+    """Records events from the UI thread without ever touching the disk there.
+
+    ``record`` appends to a bounded in-memory ring and a pending batch; a
+    writer thread flushes the batch every ``flush_every`` events or
+    ``flush_interval`` seconds, rotating ``history.log`` at ``max_bytes``.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, capacity=500, flush_every=32,
+                 flush_interval=5.0, max_bytes=256 * 1024, backups=3):
+        self.directory = directory
+        self.path = os.path.join(directory, "history.log")
+        self.stats_path = os.path.join(directory, "history_stats.json")
+        self.recent = collections.deque(maxlen=capacity)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.stats = self._load_stats()
+        self._pending = []
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    def record(self, kind, intended, actual, label="", duration=0):
+        """Log one event; ``intended``/``actual`` are wall-clock epoch seconds."""
+        lateness = max(0.0, actual - intended)
+        event = (kind, actual, lateness, int(duration), label)
+        with self._cond:
+            self.recent.append(event)
+            self.stats.add(kind, actual, lateness, int(duration))
+            self._pending.append(event)
+            # First event opens a batch (writer starts its flush_interval clock)
+            if len(self._pending) == 1 or len(self._pending) >= self.flush_every:
+                self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    # ── writer thread ──
+    def _writer(self):
+        while True:
+            with self._cond:
+                # Sleep indefinitely when idle; once a batch is open, hold it for
+                # at most flush_interval or until it reaches flush_every events
+                while self._running and not self._pending:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.flush_interval
+                while self._running and len(self._pending) < self.flush_every:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(left)
+                batch, self._pending = self._pending, []
+                stats = self.stats.to_dict()
+                running = self._running
+            if batch:
+                try:
+                    self._write_batch(batch, stats)
+                except (OSError, struct.error):
+                    pass          # drop the batch, keep the writer alive
+            if not running:
+                return
+
+    def _write_batch(self, batch, stats):
+        os.makedirs(self.directory, exist_ok=True)
+        chunks = []
+        for kind, actual, lateness, duration, label in batch:
+            raw = label.encode("utf-8")[:255]
+            # Clamp to the field widths: a fire days late must not make pack() raise
+            late_ms = max(-INT32_MAX - 1, min(INT32_MAX, int(lateness * 1000)))
+            duration = max(0, min(UINT32_MAX, int(duration)))
+            chunks.append(RECORD.pack(kind, actual, late_ms, duration, len(raw)))
+            chunks.append(raw)
+        data = b"".join(chunks)
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+        tmp = self.stats_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(stats, f)
+        os.replace(tmp, self.stats_path)
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _load_stats(self):
+        try:
+            with open(self.stats_path) as f:
+                return HistoryStats.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return HistoryStats()
@@ -0,0 +1,308 @@
+"""
+🐱 Kitty Timer — fire hooks
+Local actions (a script, a FIFO line, a POST to a local HTTP endpoint) run
+when alarms fire or timers finish, on a small bounded worker pool that the
+UI and the scheduler thread only ever hand work to.
+"""
+
+import collections
+import json
+import os
+import signal
+import threading
+import time
+
+from history import DEFAULT_DIR
+
+HOOKS_FILE = "hooks.json"
+MAX_BATCH = 100          # events kept per coalesced job; the rest are only counted
+
+
+class HookTimeout(Exception):
+    pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Hooks
+# ═══════════════════════════════════════════════════════════════════════════════
+class Hook:
+    """One action, described in JSON as ``{"run": ...}``, ``{"fifo": ...}`` or
+    ``{"http": ...}`` with an optional ``"timeout"`` in seconds.
+
+    Hooks with the same kind and target share a key, which is what pending
+    work is coalesced on.
+    """
+
+    KINDS = ("run", "fifo", "http")
+
+    def __init__(self, kind, target, timeout=5.0):
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown hook kind: {kind}")
+        self.kind = kind
+        self.target = target
+        self.timeout = timeout
+        self.key = f"{kind}:{target}"
+
+    @classmethod
+    def from_spec(cls, spec, timeout=5.0):
+        """Validate one JSON spec; raises ValueError describing what is wrong."""
+        if not isinstance(spec, dict):
+            raise ValueError(f"hook must be an object, got {spec!r}")
+        kinds = [k for k in cls.KINDS if k in spec]
+        unknown = set(spec) - set(cls.KINDS) - {"timeout"}
+        if len(kinds) != 1 or unknown:
+            raise ValueError(f"hook needs exactly one of {', '.join(cls.KINDS)}: {spec!r}")
+        target = spec[kinds[0]]
+        if not isinstance(target, str) or not target:
+            raise ValueError(f"hook target must be a non-empty string: {spec!r}")
+        try:
+            timeout = float(spec.get("timeout", timeout))
+        except (TypeError, ValueError):
+            raise ValueError(f"hook timeout must be a number: {spec!r}")
+        if not timeout > 0:
+            raise ValueError(f"hook timeout must be positive: {spec!r}")
+        return cls(kinds[0], target, timeout)
+
+    def __call__(self, events, dropped=0):
+        payload = {"events": events, "count": len(events) + dropped}
+        getattr(self, "_" + self.kind)(payload)
+
+    def _run(self, payload):
+        import subprocess
+        first = payload["events"][0]
+        env = dict(os.environ, KITTY_EVENT=first["event"], KITTY_LABEL=first["label"],
+                   KITTY_COUNT=str(payload["count"]))
+        # Own session/process group, so a timeout kills the shell and everything it started
+        posix = hasattr(os, "killpg")
+        proc = subprocess.Popen(self.target, shell=True, env=env, start_new_session=posix,
+                                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE)
+        try:
+            _, stderr = proc.communicate(json.dumps(payload).encode(), timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            if posix:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+            try:
+                proc.communicate(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.wait()
+            raise HookTimeout(f"killed after {self.timeout:g}s")
+        if proc.returncode:
+            err = stderr.decode("utf-8", "replace").strip().splitlines()
+            raise RuntimeError(f"exit {proc.returncode}" + (f": {err[-1]}" if err else ""))
+
+    def _fifo(self, payload):
+        # O_NONBLOCK: with no reader the open fails at once instead of hanging a worker
+        deadline = time.monotonic() + self.timeout
+        fd = os.open(self.target, os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            data = "".join(json.dumps(e) + "\n" for e in payload["events"]).encode()
+            while data:
+                try:
+                    data = data[os.write(fd, data):]
+                except BlockingIOError:
+                    if time.monotonic() > deadline:
+                        raise HookTimeout("reader not draining the FIFO")
+                    time.sleep(0.01)
+        finally:
+            os.close(fd)
+
+    def _http(self, payload):
+        import urllib.error
+        import urllib.request
+        req = urllib.request.Request(self.target, data=json.dumps(payload).encode(),
+                                     headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                resp.read()
+        except (TimeoutError, urllib.error.URLError) as exc:
+            if isinstance(exc, TimeoutError) or isinstance(exc.reason, TimeoutError):
+                raise HookTimeout(f"no response in {self.timeout:g}s")
+            raise
+
+
+def parse_hooks(specs, where, problems):
+    """Valid hooks from a list of specs; bad entries are skipped and noted in ``problems``."""
+    if not isinstance(specs, list):
+        problems.append(f"{where}: expected a list of hooks")
+        return []
+    hooks = []
+    for i, spec in enumerate(specs):
+        try:
+            hooks.append(Hook.from_spec(spec))
+        except ValueError as exc:
+            problems.append(f"{where}[{i}]: {exc}")
+    return hooks
+
+
+def load_hooks(directory=DEFAULT_DIR):
+    """Read ``hooks.json``: ``{"global": [spec, ...], "alarms": {label: [spec, ...]}}``.
+
+    Returns ``(global_hooks, per_alarm, problems)``. Nothing in the file can
+    raise: invalid entries are dropped and listed in ``problems`` for the
+    front end to report, and the valid ones still load.
+    """
+    problems = []
+    try:
+        with open(os.path.join(directory, HOOKS_FILE)) as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return [], {}, problems
+    except (OSError, ValueError) as exc:
+        config, problems = {}, [f"{HOOKS_FILE}: {exc}"]
+    if not isinstance(config, dict):
+        config, problems = {}, [f"{HOOKS_FILE}: expected an object"]
+
+    global_hooks = parse_hooks(config.get("global", []), "global", problems)
+    per_alarm = {}
+    alarms = config.get("alarms", {})
+    if isinstance(alarms, dict):
+        for label, specs in alarms.items():
+            per_alarm[label] = parse_hooks(specs, f"alarms[{label!r}]", problems)
+    else:
+        problems.append("alarms: expected an object of label -> hooks")
+    return global_hooks, per_alarm, problems
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Runner
+# ═══════════════════════════════════════════════════════════════════════════════
+class HookRunner:
+    """Bounded pool that runs hooks off every latency-sensitive thread.
+
+    ``fire`` only appends to a pending table under a lock and never blocks:
+    events for a hook that already has pending work are coalesced into that
+    job, at most ``max_pending`` distinct jobs wait (new ones are dropped and
+    counted beyond that), and a hook never runs on two workers at once.
+    Workers start on the first fire, so a config without hooks costs nothing.
+    Specs are validated before any fire; bad ones end up in ``problems``.
+    """
+
+    def __init__(self, global_hooks=(), per_alarm=None, problems=(), workers=2,
+                 max_pending=32, on_result=None):
+        self.global_hooks = list(global_hooks)
+        self.per_alarm = per_alarm or {}
+        self.problems = list(problems)
+        self.workers = workers
+        self.max_pending = max_pending
+        self.on_result = on_result
+        self.stats = {}                              # hook key -> counters
+        self._pending = collections.OrderedDict()    # hook key -> [hook, events, dropped, queued_at]
+        self._busy = set()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._running = True
+
+    def hooks_for(self, alarm=None):
+        hooks = list(self.global_hooks)
+        if alarm is not None:
+            hooks += self.per_alarm.get(alarm.get("time"), ())
+        return hooks
+
+    def fire(self, event, label, intended, alarm=None):
+        """Queue ``event`` ("alarm" / "timer") for every matching hook."""
+        hooks = self.hooks_for(alarm)
+        if not hooks:
+            return
+        item = {"event": event, "label": label, "intended": intended, "fired": time.time()}
+        now = time.monotonic()
+        with self._cond:
+            if not self._running:
+                return
+            for hook in hooks:
+                st = self._stat(hook.key)
+                st["events"] += 1
+                job = self._pending.get(hook.key)
+                if job is not None:
+                    st["coalesced"] += 1
+                    if len(job[1]) < MAX_BATCH:
+                        job[1].append(item)
+                    else:
+                        job[2] += 1
+                elif len(self._pending) >= self.max_pending:
+                    st["dropped"] += 1
+                else:
+                    self._pending[hook.key] = [hook, [item], 0, now]
+            if len(self._threads) < self.workers:
+                self._spawn()
+            self._cond.notify_all()
+
+    def close(self, timeout=1.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        end = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0.0, end - time.monotonic()))
+
+    def report(self):
+        """Per-hook counters plus average/max queue wait and run time in ms."""
+        with self._cond:
+            out = {}
+            for key, st in self.stats.items():
+                row = dict(st)
+                row["run_avg_ms"] = st["run_sum"] * 1000 / st["runs"] if st["runs"] else 0.0
+                row["run_max_ms"] = st["run_max"] * 1000
+                row["wait_max_ms"] = st["wait_max"] * 1000
+                del row["run_sum"], row["run_max"], row["wait_max"]
+                out[key] = row
+            return out
+
+    # ── workers ──
+    def _stat(self, key):
+        st = self.stats.get(key)
+        if st is None:
+            st = self.stats[key] = {"events": 0, "runs": 0, "coalesced": 0, "dropped": 0,
+                                    "failures": 0, "timeouts": 0, "last_error": "",
+                                    "run_sum": 0.0, "run_max": 0.0, "wait_max": 0.0}
+        return st
+
+    def _spawn(self):
+        t = threading.Thread(target=self._work, name=f"kitty-hook-{len(self._threads)}",
+                             daemon=True)
+        self._threads.append(t)
+        t.start()
+
+    def _next_job(self):
+        for key in self._pending:
+            if key not in self._busy:
+                self._busy.add(key)
+                return self._pending.pop(key)
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None and self._running:
+                    self._cond.wait()
+                    job = self._next_job()
+                if job is None:
+                    return
+            hook, events, dropped, queued_at = job
+            started = time.monotonic()
+            error = None
+            try:
+                hook(events, dropped)
+            except Exception as exc:     # a broken hook must not kill the worker
+                error = exc
+            done = time.monotonic()
+            with self._cond:
+                self._busy.discard(hook.key)
+                st = self._stat(hook.key)
+                st["runs"] += 1
+                st["run_sum"] += done - started
+                st["run_max"] = max(st["run_max"], done - started)
+                st["wait_max"] = max(st["wait_max"], started - queued_at)
+                if error is not None:
+                    st["failures"] += 1
+                    st["timeouts"] += isinstance(error, HookTimeout)
+                    st["last_error"] = f"{type(error).__name__}: {error}"
+                self._cond.notify_all()
+            if self.on_result:
+                self.on_result(hook, len(events) + dropped, done - queued_at, error)
@@ -0,0 +1,99 @@
+"""
+🐱 Kitty Timer — on-demand sampling profiler
+Periodically snapshots selected threads' stacks via ``sys._current_frames``
+and writes them in collapsed-stack (flamegraph) format. No thread, hook or
+timer exists until a capture is started.
+"""
+
+import collections
+import os
+import sys
+import threading
+import time
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Samples the stacks of named threads for a fixed window.
+
+    ``targets`` maps a label to a ``threading.Thread`` (or a callable
+    returning one, for threads that may be replaced). Each capture runs on
+    its own daemon thread and writes ``<directory>/kitty-<time>.collapsed``.
+    """
+
+    def __init__(self, targets, directory, interval=0.005, duration=10.0, on_done=None):
+        self.targets = targets
+        self.directory = directory
+        self.interval = interval
+        self.duration = duration
+        self.on_done = on_done
+        self._stop = None
+        self._thread = None
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def toggle(self):
+        if self.active:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self, duration=None):
+        if self.active:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(duration or self.duration, self._stop),
+            name="kitty-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    # ── sampler thread ──
+    def _resolve(self):
+        idents = {}
+        for label, target in self.targets.items():
+            thread = target() if callable(target) else target
+            if thread is not None and thread.ident is not None:
+                idents[thread.ident] = label
+        return idents
+
+    def _run(self, duration, stop):
+        counts = collections.Counter()
+        samples = 0
+        end = time.monotonic() + duration
+        while not stop.is_set() and time.monotonic() < end:
+            idents = self._resolve()
+            frames = sys._current_frames()
+            for ident, label in idents.items():
+                frame = frames.get(ident)
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                stack.append(label)
+                counts[";".join(reversed(stack))] += 1
+            del frames
+            samples += 1
+            stop.wait(self.interval)
+
+        path = self._write(counts)
+        if self.on_done:
+            self.on_done(path, samples)
+
+    def _write(self, counts):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory,
+                            time.strftime("kitty-%Y%m%d-%H%M%S.collapsed"))
+        with open(path, "w") as f:
+            for stack, n in counts.most_common():
+                f.write(f"{stack} {n}\n")
+        return path
@@ -0,0 +1,367 @@
+"""
+🐱 Kitty Timer — scheduling
+Recurrence rules, a single-deadline alarm scheduler and precompiled timer
+sequences shared by the front ends.
+"""
+
+import bisect
+import datetime
+import heapq
+import threading
+import time
+
+# ─── Recurrence kinds ────────────────────────────────────────────────────────
+REPEAT_DAILY    = "daily"
+REPEAT_ONCE     = "once"
+REPEAT_WEEKDAYS = "weekdays"
+REPEAT_DATES    = "dates"
+REPEAT_INTERVAL = "interval"
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Upper bound on a single sleep so wall-clock jumps (NTP, DST, suspend) are noticed.
+MAX_SLEEP = 60.0
+
+
+def to_24h(h, period):
+    """Convert a 12-hour clock hour + AM/PM into 0-23."""
+    if period == "AM":
+        return 0 if h == 12 else h
+    return h if h == 12 else h + 12
+
+
+def make_repeat(kind=REPEAT_DAILY, days=None, dates=None, minutes=None, start=None):
+    """Build a recurrence rule dict.
+
+    ``days`` are weekday numbers (Mon=0), ``dates`` are ``datetime.date``
+    objects or ``YYYY-MM-DD`` strings, ``minutes``/``start`` describe an
+    interval rule anchored at epoch time ``start``.
+    """
+    rule = {"kind": kind}
+    if kind == REPEAT_WEEKDAYS:
+        rule["days"] = tuple(sorted(set(days or ())))
+        if not rule["days"]:
+            raise ValueError("weekday rule needs at least one day")
+    elif kind == REPEAT_DATES:
+        parsed = set()
+        for d in dates or ():
+            if isinstance(d, str):
+                d = datetime.date.fromisoformat(d.strip())
+            parsed.add(d)
+        if not parsed:
+            raise ValueError("date rule needs at least one date")
+        rule["dates"] = sorted(parsed)
+    elif kind == REPEAT_INTERVAL:
+        if not minutes or minutes <= 0:
+            raise ValueError("interval rule needs a positive number of minutes")
+        rule["minutes"] = int(minutes)
+        rule["start"] = time.time() if start is None else start
+    elif kind not in (REPEAT_DAILY, REPEAT_ONCE):
+        raise ValueError(f"unknown repeat kind: {kind}")
+    return rule
+
+
+def describe_repeat(rule):
+    """Short human label for a recurrence rule."""
+    kind = rule["kind"] if rule else REPEAT_DAILY
+    if kind == REPEAT_ONCE:
+        return "once"
+    if kind == REPEAT_WEEKDAYS:
+        days = rule["days"]
+        if days == (0, 1, 2, 3, 4):
+            return "weekdays"
+        if days == (5, 6):
+            return "weekends"
+        return ",".join(WEEKDAY_NAMES[d] for d in days)
+    if kind == REPEAT_DATES:
+        if len(rule["dates"]) == 1:
+            return rule["dates"][0].strftime("%b %d")
+        return f"{len(rule['dates'])} dates"
+    if kind == REPEAT_INTERVAL:
+        return f"every {rule['minutes']} min"
+    return "daily"
+
+
+def alarm_label(h, m, period, repeat=None):
+    """Display string for an alarm, e.g. ``07:30 AM · weekdays``."""
+    label = f"{h:02d}:{m:02d} {period}"
+    if repeat and repeat["kind"] != REPEAT_DAILY:
+        label = f"{label} · {describe_repeat(repeat)}"
+    return label
+
+
+def _at(day, hour, minute):
+    """Epoch seconds for local ``hour:minute`` on ``day``."""
+    return datetime.datetime.combine(day, datetime.time(hour, minute)).timestamp()
+
+
+def interval_start(h, m, period, now=None):
+    """Anchor for an interval rule: today's ``h:m``, so fires land on h:m + k * step.
+
+    A time already past today is fine; ``next_occurrence`` steps forward
+    along the same grid.
+    """
+    day = datetime.date.fromtimestamp(time.time() if now is None else now)
+    return _at(day, to_24h(h, period), m)
+
+
+def next_occurrence(alarm, after):
+    """Return the first fire time strictly after epoch ``after``, or None.
+
+    Runs in constant time for every rule except ``dates``, which bisects
+    its sorted date list.
+    """
+    rule = alarm.get("repeat") or {"kind": REPEAT_DAILY}
+    kind = rule["kind"]
+
+    if kind == REPEAT_INTERVAL:
+        step = rule["minutes"] * 60
+        start = rule["start"]
+        if after < start:
+            return start
+        return start + (int((after - start) // step) + 1) * step
+
+    hour = to_24h(alarm["h"], alarm["period"])
+    minute = alarm["m"]
+    today = datetime.date.fromtimestamp(after)
+
+    if kind == REPEAT_DATES:
+        dates = rule["dates"]
+        i = bisect.bisect_left(dates, today)
+        while i < len(dates):
+            ts = _at(dates[i], hour, minute)
+            if ts > after:
+                return ts
+            i += 1
+        return None
+
+    if kind == REPEAT_ONCE:
+        if alarm.get("fired"):
+            return None
+        ts = _at(today, hour, minute)
+        if ts > after:
+            return ts
+        return _at(today + datetime.timedelta(days=1), hour, minute)
+
+    if kind == REPEAT_WEEKDAYS:
+        days = rule["days"]
+        for offset in range(8):
+            day = today + datetime.timedelta(days=offset)
+            if day.weekday() in days:
+                ts = _at(day, hour, minute)
+                if ts > after:
+                    return ts
+        return None
+
+    ts = _at(today, hour, minute)
+    if ts > after:
+        return ts
+    return _at(today + datetime.timedelta(days=1), hour, minute)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Alarm Scheduler
+# ═══════════════════════════════════════════════════════════════════════════════
+class AlarmScheduler:
+    """Min-heap of alarm deadlines served by one sleeping thread.
+
+    Each alarm costs one ``next_occurrence`` call when it is added and one
+    per fire; between fires the thread sleeps until the earliest deadline,
+    so idle cost does not grow with the number of alarms. ``clock`` returns
+    epoch seconds and ``mono_clock`` monotonic ones; ``simulate.py`` swaps
+    in virtual ones.
+
+    Each deadline is also noted on the monotonic clock when it is scheduled,
+    so ``on_fire(alarm, deadline, due_mono)`` callers can tell lateness
+    apart from wall-clock steps.
+    """
+
+    def __init__(self, on_fire, clock=time.time, mono_clock=time.monotonic):
+        self.on_fire = on_fire
+        self.clock = clock
+        self.mono_clock = mono_clock
+        self._heap = []          # [deadline, alarm_id]
+        self._alarms = {}        # alarm_id -> (alarm, deadline, monotonic deadline)
+        self._stale = 0          # heap entries whose alarm was removed
+        self._cond = threading.Condition()
+        self._running = False
+        self.thread = None
+
+    def add(self, alarm, now=None):
+        now = self.clock() if now is None else now
+        with self._cond:
+            self._schedule(alarm, now)
+            self._cond.notify()
+
+    def remove(self, alarm_id):
+        with self._cond:
+            # Stale heap entries are skipped lazily when they surface, but
+            # compacted once they outnumber live ones so churn can't grow the heap.
+            if self._alarms.pop(alarm_id, None) is not None:
+                self._stale += 1
+                if self._stale > 64 and self._stale > len(self._heap) // 2:
+                    self._heap = [[entry[1], aid] for aid, entry in self._alarms.items()]
+                    heapq.heapify(self._heap)
+                    self._stale = 0
+            self._cond.notify()
+
+    def is_scheduled(self, alarm_id):
+        with self._cond:
+            return alarm_id in self._alarms
+
+    def deadline(self, alarm_id):
+        """Next fire time of one alarm, or None if it is not scheduled."""
+        with self._cond:
+            entry = self._alarms.get(alarm_id)
+            return entry[1] if entry else None
+
+    def next_deadline(self):
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def timeout(self, now):
+        """How long the scheduler thread sleeps at ``now``; None means until notified."""
+        with self._cond:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            return min(MAX_SLEEP, self._heap[0][0] - now)
+
+    def pop_due(self, now):
+        """Pop every alarm due at ``now`` and reschedule recurring ones.
+
+        Returns ``(alarm, deadline, due_mono)`` in deadline order.
+        """
+        due = []
+        with self._cond:
+            while True:
+                self._drop_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                deadline, alarm_id = heapq.heappop(self._heap)
+                alarm, _, due_mono = self._alarms.pop(alarm_id)
+                due.append((alarm, deadline, due_mono))
+                alarm["fired"] = True
+                # Reschedule from max(now, deadline) so a late wake-up
+                # never replays a backlog of missed occurrences.
+                self._schedule(alarm, max(now, deadline))
+        return due
+
+    def start(self):
+        self._running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    # ── internals ──
+    def _schedule(self, alarm, after):
+        deadline = next_occurrence(alarm, after)
+        if deadline is None:
+            self._alarms.pop(alarm["id"], None)
+            return
+        due_mono = self.mono_clock() + (deadline - self.clock())
+        self._alarms[alarm["id"]] = (alarm, deadline, due_mono)
+        heapq.heappush(self._heap, [deadline, alarm["id"]])
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap:
+            deadline, alarm_id = heap[0]
+            entry = self._alarms.get(alarm_id)
+            if entry is not None and entry[1] == deadline:
+                return
+            heapq.heappop(heap)
+            if entry is None and self._stale:
+                self._stale -= 1
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                timeout = self.timeout(self.clock())
+                if timeout is None or timeout > 0:
+                    self._cond.wait(timeout)
+                    continue
+            for alarm, deadline, due_mono in self.pop_due(self.clock()):
+                self.on_fire(alarm, deadline, due_mono)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Timer Sequences
+# ═══════════════════════════════════════════════════════════════════════════════
+# name -> [(phase label, seconds), ...]
+TIMER_SEQUENCES = {
+    "Pomodoro": [("Focus", 25 * 60), ("Short break", 5 * 60)] * 3
+                + [("Focus", 25 * 60), ("Long break", 15 * 60)],
+    "52 / 17":  [("Focus", 52 * 60), ("Break", 17 * 60)],
+    "Deep work": [("Focus", 90 * 60), ("Break", 20 * 60)] * 2,
+}
+
+
+class TimerSequence:
+    """A chain of phases compiled up front into absolute monotonic deadlines.
+
+    ``ends[i]`` is computed as ``start + sum(durations[:i + 1])`` rather than
+    by adding each phase to the previous (late) boundary, so lateness at one
+    boundary never carries into the next and the final end is fixed at start.
+    """
+
+    def __init__(self, name, phases, start):
+        self.name = name
+        self.labels = [label for label, _ in phases]
+        self.durations = [seconds for _, seconds in phases]
+        self.ends = []
+        total = 0
+        for seconds in self.durations:
+            total += seconds
+            self.ends.append(start + total)
+        self.index = 0
+
+    @classmethod
+    def restore(cls, name, phases, ends, index):
+        """Rebuild a sequence from saved boundaries (see ``checkpoint.py``)."""
+        seq = cls(name, phases, 0)
+        seq.ends = list(ends)
+        seq.index = index
+        return seq
+
+    def __len__(self):
+        return len(self.durations)
+
+    @property
+    def label(self):
+        return self.labels[self.index]
+
+    @property
+    def duration(self):
+        return self.durations[self.index]
+
+    @property
+    def deadline(self):
+        return self.ends[self.index]
+
+    @property
+    def finished(self):
+        return self.index >= len(self.durations)
+
+    def phase_at(self, now):
+        """Index of the phase running at monotonic time ``now``."""
+        return bisect.bisect_right(self.ends, now)
+
+    def advance(self, now):
+        """Move to the phase running at ``now``; returns how many were passed."""
+        new = min(self.phase_at(now), len(self.durations))
+        passed = new - self.index
+        self.index = new
+        return passed
+
+    def shift(self, delta):
+        """Delay the current and later boundaries by ``delta`` s (after a pause)."""
+        for i in range(self.index, len(self.ends)):
+            self.ends[i] += delta
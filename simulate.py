@@ -0,0 +1,254 @@
+"""
+🐱 Kitty Timer — time-warp simulation
+Replays days of alarms and timer sequences against a virtual clock through
+the real ``AlarmScheduler`` and ``TimerSequence`` code, recording every fire
+with its simulated lateness. Doubles as a correctness check (fires are
+compared with an independent day-by-day expansion of each rule) and as a
+scheduler throughput benchmark.
+"""
+
+import argparse
+import csv
+import datetime
+import heapq
+import random
+import sys
+import time
+
+from scheduler import (AlarmScheduler, TimerSequence, TIMER_SEQUENCES,
+                       make_repeat, to_24h, alarm_label,
+                       REPEAT_DAILY, REPEAT_ONCE, REPEAT_WEEKDAYS,
+                       REPEAT_DATES, REPEAT_INTERVAL)
+
+FIRE_ALARM = "alarm"
+FIRE_TIMER = "timer"
+
+
+class VirtualClock:
+    """Wall and monotonic time that only move when told to.
+
+    ``time`` and ``monotonic`` keep a fixed offset, as the real clocks do
+    between NTP steps, so timer and alarm paths share one timeline.
+    """
+
+    def __init__(self, start):
+        self.now = float(start)
+        self.offset = 1000.0 - start     # arbitrary monotonic origin
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now + self.offset
+
+    def advance(self, seconds):
+        self.now += max(0.0, seconds)
+
+    def advance_to(self, t):
+        self.now = max(self.now, t)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Workload
+# ═══════════════════════════════════════════════════════════════════════════════
+def random_alarms(n, start, days, rng):
+    """``n`` alarm dicts with a mix of every recurrence kind."""
+    first = datetime.date.fromtimestamp(start)
+    alarms = []
+    for i in range(n):
+        h, m, period = rng.randint(1, 12), rng.randint(0, 59), rng.choice(("AM", "PM"))
+        roll = rng.random()
+        if roll < 0.4:
+            repeat = make_repeat(REPEAT_DAILY)
+        elif roll < 0.6:
+            repeat = make_repeat(REPEAT_WEEKDAYS, days=rng.sample(range(7), rng.randint(1, 5)))
+        elif roll < 0.7:
+            repeat = make_repeat(REPEAT_ONCE)
+        elif roll < 0.8:
+            dates = [first + datetime.timedelta(days=rng.randint(-2, days + 2))
+                     for _ in range(rng.randint(1, 6))]
+            repeat = make_repeat(REPEAT_DATES, dates=dates)
+        else:
+            repeat = make_repeat(REPEAT_INTERVAL, minutes=rng.choice((60, 90, 120, 240, 360)),
+                                 start=start - rng.uniform(0, 86400))
+        alarms.append({"time": alarm_label(h, m, period, repeat), "id": i + 1,
+                       "h": h, "m": m, "period": period, "repeat": repeat})
+    return alarms
+
+
+def expected_fires(alarm, start, end):
+    """Deadlines in ``(start, end]`` by brute-force expansion of the rule."""
+    rule = alarm["repeat"]
+    kind = rule["kind"]
+    if kind == REPEAT_INTERVAL:
+        step = rule["minutes"] * 60
+        k = max(0, int((start - rule["start"]) // step))
+        out = []
+        while rule["start"] + k * step <= end:
+            ts = rule["start"] + k * step
+            if ts > start:
+                out.append(ts)
+            k += 1
+        return out
+
+    hour, minute = to_24h(alarm["h"], alarm["period"]), alarm["m"]
+    day = datetime.date.fromtimestamp(start)
+    last = datetime.date.fromtimestamp(end)
+    out = []
+    while day <= last:
+        if (kind in (REPEAT_DAILY, REPEAT_ONCE)
+                or (kind == REPEAT_WEEKDAYS and day.weekday() in rule["days"])
+                or (kind == REPEAT_DATES and day in rule["dates"])):
+            ts = datetime.datetime.combine(day, datetime.time(hour, minute)).timestamp()
+            if start < ts <= end:
+                out.append(ts)
+                if kind == REPEAT_ONCE:
+                    break
+        day += datetime.timedelta(days=1)
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Simulation
+# ═══════════════════════════════════════════════════════════════════════════════
+def run_simulation(alarms=3000, days=30, timers=300, start=None, seed=0,
+                   jitter_ms=2.0, fire_cost_ms=0.05, record=None):
+    """Fast-forward ``days`` of schedule; returns a result dict.
+
+    The loop stands in for the scheduler thread and the UI thread at once:
+    it sleeps (jumps) exactly as long as ``AlarmScheduler.timeout`` says,
+    wakes ``jitter_ms`` late at most, and spends ``fire_cost_ms`` of virtual
+    time per fire handled, so bursts show up as queueing lateness.
+    """
+    rng = random.Random(seed)
+    if start is None:
+        start = datetime.datetime.combine(datetime.date.today(), datetime.time()).timestamp()
+    end = start + days * 86400
+    clock = VirtualClock(start)
+    scheduler = AlarmScheduler(on_fire=None, clock=clock.time, mono_clock=clock.monotonic)
+    pool = random_alarms(alarms, start, days, rng)
+    for alarm in pool:
+        scheduler.add(alarm)
+
+    # Timer starts (wall) -> a single countdown or one of the sequences
+    names = list(TIMER_SEQUENCES)
+    starts = sorted(rng.uniform(start, end) for _ in range(timers))
+    timer_heap = []          # [monotonic deadline, timer id, sequence]
+    fires = []               # (kind, id, intended wall, actual wall)
+    wakeups = 0
+    jitter, cost = jitter_ms / 1000, fire_cost_ms / 1000
+    t0 = time.perf_counter()
+
+    while True:
+        timeout = scheduler.timeout(clock.time())
+        alarm_wake = clock.time() + max(0.0, timeout) if timeout is not None else end + 1
+        timer_due = (timer_heap[0][0] - clock.offset) if timer_heap else end + 1
+        next_start = starts[0] if starts else end + 1
+        wake = min(alarm_wake, timer_due, next_start)
+        if wake > end:
+            break
+        clock.advance_to(wake + rng.uniform(0, jitter))
+        wakeups += 1
+
+        while starts and starts[0] <= clock.time():
+            starts.pop(0)
+            if rng.random() < 0.5:
+                name, phases = "single", [("Timer", rng.choice((60, 300, 1500, 3600)))]
+            else:
+                name = rng.choice(names)
+                phases = TIMER_SEQUENCES[name]
+            seq = TimerSequence(name, phases, clock.monotonic())
+            heapq.heappush(timer_heap, [seq.deadline, timers - len(starts), seq])
+
+        for alarm, deadline, _ in scheduler.pop_due(clock.time()):
+            fires.append((FIRE_ALARM, alarm["id"], deadline, clock.time()))
+            clock.advance(cost)
+
+        while timer_heap and timer_heap[0][0] <= clock.monotonic():
+            deadline, n, seq = heapq.heappop(timer_heap)
+            now_m = clock.monotonic()
+            fires.append((FIRE_TIMER, n, deadline - clock.offset, clock.time()))
+            seq.advance(max(now_m, deadline))
+            if not seq.finished:
+                heapq.heappush(timer_heap, [seq.deadline, n, seq])
+            clock.advance(cost)
+
+    elapsed = time.perf_counter() - t0
+    failures = check_fires(pool, fires, start, end)
+    lateness = sorted(actual - intended for _, _, intended, actual in fires)
+    if record:
+        with open(record, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("kind", "id", "intended", "actual", "lateness_ms"))
+            for kind, fid, intended, actual in fires:
+                writer.writerow((kind, fid, f"{intended:.3f}", f"{actual:.3f}",
+                                 f"{(actual - intended) * 1000:.3f}"))
+
+    def pct(p):
+        return lateness[min(len(lateness) - 1, int(p * len(lateness)))] if lateness else 0.0
+
+    return {
+        "alarms": alarms, "days": days, "fires": len(fires),
+        "timer_fires": sum(1 for f in fires if f[0] == FIRE_TIMER),
+        "wakeups": wakeups, "seconds": elapsed,
+        "fires_per_s": len(fires) / elapsed if elapsed else 0.0,
+        "late_p50": pct(0.50), "late_p99": pct(0.99), "late_max": lateness[-1] if lateness else 0.0,
+        "failures": failures,
+    }
+
+
+def check_fires(alarms, fires, start, end):
+    """Compare alarm fires with ``expected_fires``; returns a list of problems."""
+    got = {}
+    failures = []
+    for kind, fid, intended, actual in fires:
+        if actual < intended:
+            failures.append(f"{kind} {fid} fired {intended - actual:.3f}s early")
+        if kind == FIRE_ALARM:
+            got.setdefault(fid, []).append(intended)
+    for alarm in alarms:
+        want = expected_fires(alarm, start, end)
+        have = got.get(alarm["id"], [])
+        if have != want:
+            failures.append(f"alarm {alarm['id']} ({alarm['time']}): "
+                            f"{len(have)} fires, expected {len(want)}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a schedule on a virtual clock")
+    parser.add_argument("--alarms", type=int, default=3000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--timers", type=int, default=300,
+                        help="timers / sequences started at random times")
+    parser.add_argument("--start", help="first day, YYYY-MM-DD (default: today)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=2.0,
+                        help="worst-case wake-up latency of the sleeping thread")
+    parser.add_argument("--fire-cost-ms", type=float, default=0.05,
+                        help="virtual time spent handling each fire")
+    parser.add_argument("--record", metavar="CSV", help="write every fire to this file")
+    args = parser.parse_args(argv)
+
+    start = None
+    if args.start:
+        day = datetime.date.fromisoformat(args.start)
+        start = datetime.datetime.combine(day, datetime.time()).timestamp()
+    result = run_simulation(args.alarms, args.days, args.timers, start, args.seed,
+                            args.jitter_ms, args.fire_cost_ms, args.record)
+
+    print(f"{result['alarms']} alarms over {result['days']} days: "
+          f"{result['fires']} fires ({result['timer_fires']} timer), "
+          f"{result['wakeups']} wake-ups")
+    print(f"lateness  p50 {result['late_p50'] * 1000:.2f} ms  "
+          f"p99 {result['late_p99'] * 1000:.2f} ms  max {result['late_max'] * 1000:.2f} ms")
+    print(f"replayed in {result['seconds']:.2f} s  ({result['fires_per_s']:,.0f} fires/s)")
+    for failure in result["failures"][:20]:
+        print("FAIL", failure)
+    if result["failures"]:
+        print(f"{len(result['failures'])} problem(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
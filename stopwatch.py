@@ -0,0 +1,106 @@
+"""
+🐱 Kitty Timer — stopwatch
+Nanosecond stopwatch with a compact lap buffer, independent of any display.
+"""
+
+import time
+from array import array
+
+
+def format_ns(ns):
+    """Format nanoseconds as ``MM:SS.cc`` (or ``H:MM:SS.cc`` past an hour)."""
+    cs = ns // 10_000_000
+    secs, cs = divmod(cs, 100)
+    mins, secs = divmod(secs, 60)
+    hrs, mins = divmod(mins, 60)
+    if hrs:
+        return f"{hrs}:{mins:02d}:{secs:02d}.{cs:02d}"
+    return f"{mins:02d}:{secs:02d}.{cs:02d}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Lap Buffer
+# ═══════════════════════════════════════════════════════════════════════════════
+class LapBuffer:
+    """Split times in a flat ``array('q')`` — 8 bytes per lap.
+
+    Fastest/slowest laps are tracked as laps arrive, so nothing ever rescans
+    the buffer.
+    """
+
+    def __init__(self):
+        self.splits = array("q")
+        self.best = -1
+        self.worst = -1
+
+    def __len__(self):
+        return len(self.splits)
+
+    def append(self, split_ns):
+        i = len(self.splits)
+        self.splits.append(split_ns)
+        lap = self.lap(i)
+        if self.best < 0 or lap < self.lap(self.best):
+            self.best = i
+        if self.worst < 0 or lap > self.lap(self.worst):
+            self.worst = i
+        return lap
+
+    def split(self, i):
+        return self.splits[i]
+
+    def lap(self, i):
+        return self.splits[i] - (self.splits[i - 1] if i else 0)
+
+    def clear(self):
+        self.splits = array("q")
+        self.best = self.worst = -1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Stopwatch
+# ═══════════════════════════════════════════════════════════════════════════════
+class Stopwatch:
+    """Start/stop/lap stopwatch on ``time.perf_counter_ns``.
+
+    Every control reads the clock first, before doing anything else, so the
+    recorded times never depend on how long the UI takes to repaint.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.running = False
+        self._started = 0        # clock value when the current run began
+        self._accumulated = 0    # ns from earlier runs (before a stop)
+        self.laps = LapBuffer()
+
+    def elapsed_ns(self, now=None):
+        if not self.running:
+            return self._accumulated
+        now = self.clock() if now is None else now
+        return self._accumulated + now - self._started
+
+    def start(self):
+        now = self.clock()
+        if not self.running:
+            self._started = now
+            self.running = True
+
+    def stop(self):
+        now = self.clock()
+        if self.running:
+            self._accumulated += now - self._started
+            self.running = False
+
+    def lap(self):
+        """Record a lap at the current instant and return its duration in ns."""
+        now = self.clock()
+        if not self.running:
+            return None
+        return self.laps.append(self.elapsed_ns(now))
+
+    def reset(self):
+        self.running = False
+        self._started = 0
+        self._accumulated = 0
+        self.laps.clear()
@@ -0,0 +1,212 @@
+"""
+🐱 Kitty Timer — scheduling telemetry
+How late timers complete and alarms fire, measured against both the
+monotonic and the wall clock and kept in fixed-size log histograms.
+``python telemetry.py`` prints p50/p99/max from the local dump and can fail
+when a p99 exceeds an SLO.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from array import array
+
+from history import DEFAULT_DIR
+
+TELEMETRY_FILE = "telemetry.json"
+VERSION = 1
+
+# Bucket 0 is [0, 0.1 ms); bucket i covers 0.1 ms * 10**((i-1)/10) .. 10**(i/10),
+# i.e. ten buckets per decade (~26 % wide) up to ~63 s (bucket 58); bucket 59
+# is the overflow for everything later.
+MIN_MS = 0.1
+BUCKETS_PER_DECADE = 10
+NUM_BUCKETS = 60
+
+SERIES = ("timer", "alarm")
+CLOCKS = ("monotonic", "wall")
+
+
+def bucket_of(ms):
+    if ms < MIN_MS:
+        return 0
+    return min(NUM_BUCKETS - 1, 1 + int(BUCKETS_PER_DECADE * math.log10(ms / MIN_MS)))
+
+
+def upper_edge_ms(i):
+    return MIN_MS * 10 ** (i / BUCKETS_PER_DECADE)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Histogram
+# ═══════════════════════════════════════════════════════════════════════════════
+class LatencyHistogram:
+    """Lateness in 60 counters plus exact count/sum/max.
+
+    Early events (negative lateness, e.g. after the wall clock stepped) are
+    counted in the zero bucket and also tallied separately.
+    """
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * NUM_BUCKETS))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.early = 0
+        self.early_max = 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        if seconds < 0:
+            self.early += 1
+            self.early_max = max(self.early_max, -seconds)
+            seconds = 0.0
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.counts[bucket_of(seconds * 1000)] += 1
+
+    def percentile(self, p):
+        """Upper bound of the ``p`` quantile in seconds (never above ``max``)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                if i == NUM_BUCKETS - 1:
+                    return self.max         # overflow bucket has no upper edge
+                return min(upper_edge_ms(i) / 1000, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(0.50) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+            "mean_ms": self.total * 1000 / self.count if self.count else 0.0,
+            "early": self.early,
+            "early_max_ms": self.early_max * 1000,
+        }
+
+    def to_dict(self):
+        return {"counts": list(self.counts), "count": self.count, "total": self.total,
+                "max": self.max, "early": self.early, "early_max": self.early_max}
+
+    @classmethod
+    def from_dict(cls, data):
+        hist = cls()
+        counts = data.get("counts", ())
+        if len(counts) == NUM_BUCKETS:
+            hist.counts = array("Q", counts)
+            for k in ("count", "total", "max", "early", "early_max"):
+                setattr(hist, k, data.get(k, 0))
+        return hist
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Telemetry
+# ═══════════════════════════════════════════════════════════════════════════════
+class Telemetry:
+    """One histogram per (timer|alarm, monotonic|wall), carried across runs.
+
+    ``record`` is a few additions under a lock and never touches the disk;
+    ``dump`` writes ``telemetry.json`` atomically and is called on exit and
+    on request (SIGUSR2 in the Tk app).
+    """
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, TELEMETRY_FILE)
+        self._lock = threading.Lock()
+        self.hists = {(s, c): LatencyHistogram() for s in SERIES for c in CLOCKS}
+        self.since = time.time()
+        self._load()
+
+    def record(self, series, intended_mono, actual_mono, intended_wall, actual_wall):
+        """Log one completion/fire; any intended time may be None if unknown."""
+        with self._lock:
+            if intended_mono is not None:
+                self.hists[series, "monotonic"].add(actual_mono - intended_mono)
+            if intended_wall is not None:
+                self.hists[series, "wall"].add(actual_wall - intended_wall)
+
+    def summary(self):
+        with self._lock:
+            return {f"{s}.{c}": h.summary() for (s, c), h in self.hists.items()}
+
+    def dump(self):
+        with self._lock:
+            data = {"version": VERSION, "since": self.since, "updated": time.time(),
+                    "histograms": {f"{s}.{c}": h.to_dict() for (s, c), h in self.hists.items()}}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            return None
+        return self.path
+
+    def reset(self):
+        with self._lock:
+            self.hists = {(s, c): LatencyHistogram() for s in SERIES for c in CLOCKS}
+            self.since = time.time()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != VERSION:
+            return
+        self.since = data.get("since", self.since)
+        for key, hist in data.get("histograms", {}).items():
+            series, _, clock = key.partition(".")
+            if (series, clock) in self.hists:
+                self.hists[series, clock] = LatencyHistogram.from_dict(hist)
+
+
+def format_summary(summary):
+    lines = [f"{'series':<16} {'count':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>10} {'early':>6}"]
+    for key, st in summary.items():
+        lines.append(f"{key:<16} {st['count']:>7} {st['p50_ms']:>9.1f} {st['p99_ms']:>9.1f} "
+                     f"{st['max_ms']:>10.1f} {st['early']:>6}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Timer/alarm lateness percentiles")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="directory holding telemetry.json")
+    parser.add_argument("--slo-p99-ms", type=float,
+                        help="exit non-zero if any series' p99 lateness is above this")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    parser.add_argument("--reset", action="store_true", help="clear the histograms")
+    args = parser.parse_args(argv)
+
+    telemetry = Telemetry(args.dir)
+    if args.reset:
+        telemetry.reset()
+        telemetry.dump()
+    summary = telemetry.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"since {time.strftime('%Y-%m-%d %H:%M', time.localtime(telemetry.since))}")
+        print(format_summary(summary))
+    if args.slo_p99_ms is not None:
+        over = [k for k, st in summary.items() if st["count"] and st["p99_ms"] > args.slo_p99_ms]
+        for key in over:
+            print(f"SLO miss: {key} p99 {summary[key]['p99_ms']:.1f} ms > {args.slo_p99_ms:g} ms")
+        sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,551 @@
+"""
+🐱 Kitty Timer — terminal front end
+A curses UI over the same scheduler and history modules as the Tk app, for
+headless machines and SSH sessions. Imports nothing from Tk or PIL.
+"""
+
+import argparse
+import collections
+import curses
+import math
+import os
+import select
+import sys
+import time
+
+from checkpoint import TimerCheckpoint, capture, restore
+from history import HistoryLog, EVENT_TIMER, EVENT_ALARM, DEFAULT_DIR
+from hooks import HookRunner, load_hooks
+from telemetry import Telemetry
+from scheduler import (AlarmScheduler, TimerSequence, TIMER_SEQUENCES,
+                       make_repeat, interval_start, alarm_label, WEEKDAY_NAMES,
+                       REPEAT_DAILY, REPEAT_ONCE, REPEAT_WEEKDAYS,
+                       REPEAT_DATES, REPEAT_INTERVAL)
+
+# Wake just past each wall-clock second so the clock never shows a stale digit.
+EDGE_DELAY = 0.002
+BAR_PARTIALS = " ▏▎▍▌▋▊▉█"
+CAT_FACES = {"sleeping": "(=-.-=) zzZ", "alert": "(=^.^=)", "celebrate": "\\(=^o^=)/"}
+
+KEYS_HELP = "space start/pause  r reset  +/- min  s sequence  a add alarm  d delete  q quit"
+
+
+def progress_bar(fraction, width):
+    """Bar of ``width`` cells with eighth-cell resolution."""
+    fraction = min(1.0, max(0.0, fraction))
+    eighths = int(fraction * width * 8)
+    full, part = divmod(eighths, 8)
+    bar = "█" * full
+    if full < width:
+        bar += BAR_PARTIALS[part] + " " * (width - full - 1)
+    return bar
+
+
+def format_hms(seconds):
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+def parse_alarm(text):
+    """Parse ``7:30 pm weekdays`` / ``19:30 every 15`` into ``(h, m, period, repeat)``.
+
+    Repeat words: ``once``, ``daily``, ``weekdays``, ``weekends``, ``every N``,
+    comma-separated day names (``mon,wed``) or ISO dates. Raises ValueError.
+    """
+    words = text.split()
+    if not words:
+        raise ValueError("empty alarm")
+    hh, _, mm = words.pop(0).partition(":")
+    h, m = int(hh), int(mm or 0)
+    period = None
+    if words and words[0].upper() in ("AM", "PM"):
+        period = words.pop(0).upper()
+    if period is None:
+        if not 0 <= h <= 23:
+            raise ValueError("hour out of range")
+        period = "AM" if h < 12 else "PM"
+        h = h % 12 or 12
+    if not (1 <= h <= 12 and 0 <= m <= 59):
+        raise ValueError("time out of range")
+
+    rest = " ".join(words).lower()
+    if not rest or rest == "daily":
+        repeat = make_repeat(REPEAT_DAILY)
+    elif rest == "once":
+        repeat = make_repeat(REPEAT_ONCE)
+    elif rest == "weekdays":
+        repeat = make_repeat(REPEAT_WEEKDAYS, days=range(5))
+    elif rest == "weekends":
+        repeat = make_repeat(REPEAT_WEEKDAYS, days=(5, 6))
+    elif rest.startswith("every"):
+        repeat = make_repeat(REPEAT_INTERVAL, minutes=int(rest.split()[1]),
+                             start=interval_start(h, m, period))
+    elif rest[:1].isdigit():
+        repeat = make_repeat(REPEAT_DATES, dates=rest.split(","))
+    else:
+        names = [n.lower() for n in WEEKDAY_NAMES]
+        repeat = make_repeat(REPEAT_WEEKDAYS,
+                             days=[names.index(d.strip()[:3]) for d in rest.split(",")])
+    return h, m, period, repeat
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Screen
+# ═══════════════════════════════════════════════════════════════════════════════
+class Screen:
+    """Shadow copy of the terminal; ``draw`` writes only the cells that changed.
+
+    Rows are lists of ``(text, attr)`` segments. Each row is expanded to
+    cells and compared with what is already on screen, and only runs of
+    differing cells are sent to curses.
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.shown = []
+        self.cells_written = 0
+
+    def invalidate(self):
+        self.shown = []
+        self.win.clear()
+
+    def draw(self, rows):
+        height, width = self.win.getmaxyx()
+        width -= 1               # never write the bottom-right cell
+        blank = [(" ", 0)] * width
+        if len(self.shown) > height:
+            del self.shown[height:]
+        for y in range(height):
+            cells = []
+            for text, attr in rows[y] if y < len(rows) else ():
+                cells.extend((ch, attr) for ch in text)
+            cells = cells[:width] + blank[len(cells):]
+            old = self.shown[y] if y < len(self.shown) else None
+            if old == cells:
+                continue
+            x = 0
+            while x < width:
+                if old is not None and old[x] == cells[x]:
+                    x += 1
+                    continue
+                start, attr = x, cells[x][1]
+                while x < width and (old is None or old[x] != cells[x]) and cells[x][1] == attr:
+                    x += 1
+                try:
+                    self.win.addstr(y, start, "".join(ch for ch, _ in cells[start:x]), attr)
+                except curses.error:
+                    pass
+                self.cells_written += x - start
+            if y < len(self.shown):
+                self.shown[y] = cells
+            else:
+                self.shown.append(cells)
+        self.win.noutrefresh()
+        curses.doupdate()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Terminal App
+# ═══════════════════════════════════════════════════════════════════════════════
+class KittyTerminal:
+    """Timer + alarm list driven by one ``select`` loop.
+
+    The loop sleeps until the next wall-clock second, the timer deadline,
+    a key press or an alarm fire (signalled through a self-pipe), so an idle
+    session wakes once per second and fires land on time.
+    """
+
+    def __init__(self, stdscr, history_dir=DEFAULT_DIR, minutes=25):
+        self.stdscr = stdscr
+        self.screen = Screen(stdscr)
+        self.history = HistoryLog(history_dir)
+        self.checkpoint = TimerCheckpoint(history_dir)
+        self.hooks = HookRunner(*load_hooks(history_dir), on_result=self._on_hook_result)
+        self.telemetry = Telemetry(history_dir)
+        self.running = True
+        self.message = "zzZ... Set a timer, I'll wake up!"
+        if self.hooks.problems:
+            self.message = f"hooks.json: skipped {self.hooks.problems[0]}"
+
+        # Timer state (monotonic deadlines, as in the Tk app)
+        self.timer_minutes = minutes
+        self.timer_running = False
+        self.timer_paused = False
+        self.timer_deadline = 0.0
+        self.timer_deadline_wall = None
+        self.timer_left = 0.0
+        self.timer_total_seconds = 0
+        self.timer_sequence = None
+        self.timer_done = False
+        self._sequence_names = [None] + list(TIMER_SEQUENCES)
+        self._sequence_index = 0
+        self.cat_state = "sleeping"
+        self._restore_timer()
+
+        # Alarms
+        self.alarms = []
+        self.alarm_counter = 0
+        self.selected = 0
+        self.prompt = None           # text being typed for a new alarm
+        self._fired = collections.deque()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self.alarm_scheduler = AlarmScheduler(self._on_alarm_due)
+        self.alarm_scheduler.start()
+
+        self.attr_accent = curses.A_BOLD
+        self.attr_dim = curses.A_DIM
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            curses.init_pair(1, curses.COLOR_MAGENTA, -1)
+            self.attr_accent = curses.color_pair(1) | curses.A_BOLD
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        stdscr.nodelay(True)
+        stdscr.keypad(True)
+
+    # ── main loop ──
+    def run(self):
+        self.render()
+        while self.running:
+            timeout = 1.0 - time.time() % 1.0 + EDGE_DELAY
+            if self.timer_running:
+                # Also wake on the countdown's own second edges (deadline - n)
+                left = self.timer_deadline - time.monotonic()
+                digit = left - (math.ceil(left) - 1) + EDGE_DELAY
+                timeout = min(timeout, digit, left)
+            ready, _, _ = select.select([sys.stdin, self._wake_r], [], [], max(0.0, timeout))
+            if self._wake_r in ready:
+                os.read(self._wake_r, 512)
+                while self._fired:
+                    self._alarm_triggered(*self._fired.popleft())
+            if sys.stdin in ready:
+                self._read_keys()
+            if self.timer_running and time.monotonic() >= self.timer_deadline:
+                self._timer_due()
+            self.render()
+        self.close()
+
+    def close(self):
+        self.alarm_scheduler.stop()
+        self.hooks.close(timeout=0)
+        self.telemetry.dump()
+        self.history.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _read_keys(self):
+        while True:
+            key = self.stdscr.getch()
+            if key == -1:
+                return
+            if key == curses.KEY_RESIZE:
+                self.screen.invalidate()
+            elif self.prompt is not None:
+                self._prompt_key(key)
+            else:
+                self._command_key(key)
+
+    def _command_key(self, key):
+        ch = chr(key) if 0 <= key < 256 else ""
+        if ch == "q":
+            self.running = False
+        elif ch == " ":
+            self._timer_pause() if self.timer_running or self.timer_paused else self._timer_start()
+        elif ch == "r":
+            self._timer_reset()
+        elif ch and ch in "+-=_":
+            self._adjust_minutes(1 if ch in "+=" else -1)
+        elif ch == "s":
+            self._cycle_sequence()
+        elif ch == "a":
+            self.prompt = ""
+        elif ch in ("d", "x") and self.alarms:
+            self._remove_alarm(self.alarms[self.selected]["id"])
+        elif key in (curses.KEY_UP, ord("k")):
+            self.selected = max(0, self.selected - 1)
+        elif key in (curses.KEY_DOWN, ord("j")):
+            self.selected = min(max(0, len(self.alarms) - 1), self.selected + 1)
+
+    def _prompt_key(self, key):
+        if key in (10, 13, curses.KEY_ENTER):
+            text, self.prompt = self.prompt, None
+            self._add_alarm(text)
+        elif key == 27:
+            self.prompt = None
+        elif key in (curses.KEY_BACKSPACE, 127, 8):
+            self.prompt = self.prompt[:-1]
+        elif 32 <= key < 127:
+            self.prompt += chr(key)
+
+    # ── timer ──
+    def _timer_start(self):
+        if self.timer_paused:
+            self.timer_paused = False
+            self.timer_running = True
+            deadline = time.monotonic() + self.timer_left
+            if self.timer_sequence is not None:
+                self.timer_sequence.shift(deadline - self.timer_sequence.deadline)
+            self._arm(deadline)
+            self.cat_state = "alert"
+            self.message = "Counting down... stay focused!"
+            self._checkpoint_timer()
+            return
+
+        name = self._sequence_names[self._sequence_index]
+        now_m = time.monotonic()
+        if name is not None:
+            self.timer_sequence = TimerSequence(name, TIMER_SEQUENCES[name], now_m)
+            self.timer_total_seconds = self.timer_sequence.duration
+            self._arm(self.timer_sequence.deadline)
+            self.message = f"{name}: {self.timer_sequence.label} first"
+        else:
+            self.timer_sequence = None
+            self.timer_total_seconds = self.timer_minutes * 60
+            self._arm(now_m + self.timer_total_seconds)
+            self.message = "Counting down... stay focused!"
+        self.timer_running = True
+        self.timer_done = False
+        self.cat_state = "alert"
+        self._checkpoint_timer()
+
+    def _arm(self, deadline):
+        """Set the monotonic deadline and note its wall-clock twin for telemetry."""
+        self.timer_deadline = deadline
+        self.timer_deadline_wall = time.time() + (deadline - time.monotonic())
+
+    def _lateness(self, now_m, deadline):
+        """Lateness for history; zero for a deadline that passed while we were down."""
+        if self.timer_deadline_wall is None:
+            return 0.0
+        return max(0.0, now_m - deadline)
+
+    def _adjust_minutes(self, delta):
+        if not (self.timer_running or self.timer_paused):
+            self.timer_minutes = min(999, max(1, self.timer_minutes + delta))
+            self.timer_done = False
+
+    def _timer_pause(self):
+        if self.timer_running:
+            self.timer_running = False
+            self.timer_paused = True
+            self.timer_left = max(0.0, self.timer_deadline - time.monotonic())
+            self.message = "Paused... take a break"
+            self._checkpoint_timer()
+        elif self.timer_paused:
+            self._timer_start()
+
+    def _timer_reset(self):
+        self.timer_running = False
+        self.timer_done = False
+        self.timer_paused = False
+        self.timer_sequence = None
+        self.timer_left = 0.0
+        self.timer_total_seconds = 0
+        self.cat_state = "sleeping"
+        self.message = "zzZ... Set a timer, I'll wake up!"
+        self._checkpoint_timer()
+
+    def _checkpoint_timer(self):
+        self.checkpoint.save(capture(self.timer_running, self.timer_paused,
+                                     self.timer_deadline, self.timer_left,
+                                     self.timer_total_seconds, self.timer_sequence))
+
+    def _restore_timer(self):
+        """Resume a countdown saved by this or the Tk front end; expired ones fire on the first loop."""
+        state = self.checkpoint.load()
+        if state is None:
+            return
+        try:
+            running, deadline, left, total, seq = restore(state)
+        except (KeyError, TypeError, ValueError):
+            self.checkpoint.save(None)
+            return
+        self.timer_sequence = seq
+        self.timer_total_seconds = total
+        self.timer_left = left
+        self.timer_running = running
+        self.timer_paused = not running
+        if running:
+            self._arm(deadline)
+            if deadline <= time.monotonic():
+                self.timer_deadline_wall = None    # downtime, not scheduling lateness
+        self.cat_state = "alert"
+        self.message = "Welcome back! Still counting" if running else "Paused... take a break"
+
+    def _cycle_sequence(self):
+        if self.timer_running or self.timer_paused:
+            return
+        self.timer_done = False
+        self._sequence_index = (self._sequence_index + 1) % len(self._sequence_names)
+
+    def _timer_due(self):
+        seq = self.timer_sequence
+        now_m = time.monotonic()
+        now = time.time()
+        if self.timer_deadline_wall is not None:
+            self.telemetry.record("timer", self.timer_deadline, now_m,
+                                  self.timer_deadline_wall, now)
+        if seq is not None and seq.index < len(seq) - 1:
+            self.history.record(EVENT_TIMER, now - self._lateness(now_m, seq.deadline), now,
+                                label=f"{seq.name}: {seq.label}", duration=seq.duration)
+            seq.advance(max(now_m, seq.deadline))
+            if not seq.finished:
+                self.timer_total_seconds = seq.duration
+                self._arm(seq.deadline)
+                self._checkpoint_timer()
+                focus = seq.label == "Focus"
+                self.cat_state = "alert" if focus else "sleeping"
+                self.message = "Back to focus!" if focus else f"{seq.label}! Stretch those paws"
+                curses.beep()
+                return
+            # Every remaining phase ran out while we were away; that boundary is logged
+            self.timer_deadline = seq.ends[-1]
+            self.timer_deadline_wall = None
+        else:
+            # History holds one event per phase, so a sequence logs only its last one here
+            late = self._lateness(now_m, self.timer_deadline)
+            if seq is not None:
+                phase, duration = f"{seq.name}: {seq.label}", seq.duration
+            else:
+                phase, duration = f"{self.timer_total_seconds}s timer", self.timer_total_seconds
+            self.history.record(EVENT_TIMER, now - late, now, label=phase, duration=duration)
+
+        late = max(0.0, now_m - self.timer_deadline)
+        label = f"{seq.name} sequence" if seq is not None else f"{self.timer_total_seconds}s timer"
+        self.hooks.fire("timer", label, now - late)
+        self.timer_running = False
+        self.timer_done = True
+        self.timer_sequence = None
+        self.timer_left = 0.0
+        self._checkpoint_timer()
+        self.cat_state = "celebrate"
+        self.message = "*** Time's up! Great job! ***"
+        curses.beep()
+        curses.flash()
+
+    # ── alarms ──
+    def _add_alarm(self, text):
+        try:
+            h, m, period, repeat = parse_alarm(text)
+        except (ValueError, IndexError):
+            self.message = "Try: 7:30 am weekdays | 19:00 once | 9:00 every 15 | 8:00 mon,wed"
+            return
+        time_str = alarm_label(h, m, period, repeat)
+        if any(a["time"] == time_str for a in self.alarms):
+            self.message = f"Alarm for {time_str} already exists!"
+            return
+        self.alarm_counter += 1
+        alarm = {"time": time_str, "id": self.alarm_counter, "h": h, "m": m, "period": period,
+                 "repeat": repeat}
+        self.alarms.append(alarm)
+        self.alarm_scheduler.add(alarm)
+        self.selected = len(self.alarms) - 1
+        self.message = f"Alarm set for {time_str}! I'll meow!"
+
+    def _remove_alarm(self, alarm_id):
+        self.alarm_scheduler.remove(alarm_id)
+        self.alarms = [a for a in self.alarms if a["id"] != alarm_id]
+        self.selected = min(self.selected, max(0, len(self.alarms) - 1))
+
+    def _on_alarm_due(self, alarm, deadline, due_mono=None):
+        # Scheduler thread: queue hooks, then hand over to the loop through the self-pipe
+        self.hooks.fire("alarm", alarm["time"], deadline, alarm)
+        self._fired.append((alarm, deadline, due_mono))
+        try:
+            os.write(self._wake_w, b"!")
+        except BlockingIOError:
+            pass
+
+    def _on_hook_result(self, hook, events, latency, error):
+        # Hook worker thread; shown on the next repaint
+        if error is not None:
+            self.message = f"hook {hook.key} failed: {error}"
+
+    def _alarm_triggered(self, alarm, deadline=None, due_mono=None):
+        now_m = time.monotonic()
+        now = time.time()
+        self.telemetry.record("alarm", due_mono, now_m, deadline, now)
+        self.history.record(EVENT_ALARM, deadline or now, now, label=alarm["time"])
+        if not self.alarm_scheduler.is_scheduled(alarm["id"]):
+            self._remove_alarm(alarm["id"])
+        self.cat_state = "celebrate"
+        self.message = f"*** MEOW! It's {alarm['time']}! ***"
+        curses.beep()
+        curses.flash()
+
+    # ── drawing ──
+    def render(self):
+        height, width = self.stdscr.getmaxyx()
+        accent, dim = self.attr_accent, self.attr_dim
+        rows = [
+            [(" Kitty Timer ", accent), (CAT_FACES[self.cat_state], 0),
+             (time.strftime("   %I:%M:%S %p"), accent)],
+            [],
+        ]
+
+        # Timer
+        seq = self.timer_sequence
+        name = self._sequence_names[self._sequence_index]
+        if self.timer_running or self.timer_paused:
+            left = (self.timer_left if self.timer_paused
+                    else max(0.0, self.timer_deadline - time.monotonic()))
+            total = self.timer_total_seconds
+            state = "paused" if self.timer_paused else "running"
+        elif self.timer_done:
+            left, total, state = 0.0, 1, "done"
+        else:
+            left, total, state = 0.0, 0, "idle"
+        mode = f"{name} sequence" if name else f"{self.timer_minutes} min"
+        rows.append([(" TIMER ", accent), (f"[{mode}]  {state}", dim)])
+        fraction = 1 - left / total if total else 0.0
+        bar_w = max(10, min(48, width - 20))
+        clock = format_hms(math.ceil(left)) if total else format_hms(self.timer_minutes * 60)
+        rows.append([(f"  {clock:>8}  ", accent), (progress_bar(fraction, bar_w), accent),
+                     (f" {int(fraction * 100):3d}%", 0)])
+        if seq is not None and not seq.finished:
+            rows.append([(f"  {seq.label} · phase {seq.index + 1}/{len(seq)}", dim)])
+        else:
+            rows.append([])
+        rows.append([])
+
+        # Alarms
+        rows.append([(" ALARMS ", accent), (f"({len(self.alarms)})", dim)])
+        room = max(1, height - len(rows) - 3)
+        first = min(max(0, self.selected - room + 1), max(0, len(self.alarms) - room))
+        for i, alarm in enumerate(self.alarms[first:first + room], first):
+            deadline = self.alarm_scheduler.deadline(alarm["id"])
+            when = time.strftime("next %a %H:%M", time.localtime(deadline)) if deadline else ""
+            marker = ">" if i == self.selected else " "
+            attr = curses.A_REVERSE if i == self.selected else 0
+            rows.append([(f" {marker} {alarm['time']:<28}", attr), (f" {when}", dim)])
+        if not self.alarms:
+            rows.append([("   No alarms yet (press a)", dim)])
+
+        while len(rows) < height - 2:
+            rows.append([])
+        if self.prompt is not None:
+            rows.append([(" New alarm: ", accent), (self.prompt + "_", 0)])
+        else:
+            rows.append([(f" {self.message}", 0)])
+        rows.append([(f" {KEYS_HELP}", dim)])
+        self.screen.draw(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kitty Timer in the terminal")
+    parser.add_argument("--minutes", type=int, default=25,
+                        help="initial single-timer length")
+    parser.add_argument("--history-dir", default=DEFAULT_DIR,
+                        help="where timer/alarm history is logged")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("ESCDELAY", "25")
+    curses.wrapper(lambda stdscr: KittyTerminal(stdscr, args.history_dir, args.minutes).run())
+
+
+if __name__ == "__main__":
+    main()